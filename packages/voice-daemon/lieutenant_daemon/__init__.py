@@ -25,7 +25,14 @@ def main():
     from lieutenant_daemon.server import run_server
     port = int(os.getenv("VOICE_DAEMON_PORT", "8765"))
     logger.info("Starting Lieutenant Voice Daemon on port %d", port)
-    asyncio.run(run_server(port))
+    # libuv loop when available — faster WS I/O and subprocess handling (TTS players)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(run_server(port))
+    else:
+        logger.info("Using uvloop event loop.")
+        uvloop.run(run_server(port))
 
 
 if __name__ == "__main__":
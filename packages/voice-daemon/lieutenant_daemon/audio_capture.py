@@ -17,6 +17,23 @@ BLOCK_SIZE = 1024  # ~64ms at 16kHz
 DTYPE = "int16"
 
 
+# ── Frame energy straight from int16 — no float32 copy of the frame ──
+try:
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _sum_squares_i16(x):
+        ss = 0.0
+        for i in range(x.shape[0]):
+            v = np.float32(x[i])
+            ss += v * v
+        return ss
+except ImportError:
+    def _sum_squares_i16(x):
+        f = x.astype(np.float32)
+        return float(np.dot(f, f))
+
+
 class AudioCapture:
     """Captures microphone audio in a background thread, distributes frames."""
 
@@ -56,7 +73,10 @@ class AudioCapture:
         return list(self._errors)
 
     def on_frame(self, callback: Callable[[np.ndarray], None]):
-        """Register a callback that receives int16 numpy arrays."""
+        """Register a callback that receives int16 numpy arrays.
+
+        The array is only valid during the call; copy it to keep it.
+        """
         self._frame_callbacks.append(callback)
 
     def start(self):
@@ -121,10 +141,12 @@ class AudioCapture:
         def _callback(indata: np.ndarray, frames: int, time_info: Any, status: Any):
             if status:
                 logger.warning("Audio callback status: %s", status)
-            audio = indata[:, 0].copy()
+            # A view into PortAudio's buffer, valid only for this callback —
+            # every consumer uses or copies it before returning.
+            audio = indata[:, 0]
             self._frames_received += 1
-            float_data = audio.astype(np.float32) / 32768.0
-            self._rms = float(np.sqrt(np.mean(float_data ** 2)))
+            # Sum of squares in int16 units; scale after the sqrt
+            self._rms = float(np.sqrt(_sum_squares_i16(audio) / audio.size)) * (1.0 / 32768.0)
             for cb in self._frame_callbacks:
                 try:
                     cb(audio)
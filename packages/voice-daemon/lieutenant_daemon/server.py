@@ -10,7 +10,7 @@ import time
 import httpx
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 import uvicorn
@@ -65,9 +65,23 @@ _MD_RULES: list[tuple[_re.Pattern, str]] = [
     (_re.compile(r"\n{3,}"),            "\n\n"),      # collapse blank lines
 ]
 
+# Anything any of the rules above could act on: markdown punctuation, emoji /
+# symbol code points, whitespace runs, or list markers at a line start.
+# Plain prose (Greek included) matches none of these and skips cleaning.
+_TTS_CLEAN_TRIGGER_RE = _re.compile(
+    r"[*_`\[\]#>~\\\u200d\u2600-\U0010ffff]|[ \t]{2,}|\n{3,}|^\s*(?:[-+]|\d+[.)])",
+    _re.M,
+)
+
+
+# Bare list marker like "1." or "2)" — only possible on tiny, digit-led buffers
+_LIST_MARKER_RE = _re.compile(r"^\d+[.)\s]*$")
+
 
 def _clean_for_tts(text: str) -> str:
     """Strip emojis and markdown formatting → natural spoken text."""
+    if not _TTS_CLEAN_TRIGGER_RE.search(text):
+        return text.strip()
     text = _EMOJI_RE.sub("", text)
     for pattern, repl in _MD_RULES:
         text = pattern.sub(repl, text)
@@ -95,6 +109,9 @@ _BARGEIN_FRAMES_NEEDED = int(os.getenv("BARGEIN_FRAMES_NEEDED", "8"))  # consecu
 _BARGEIN_COOLDOWN_S = float(os.getenv("BARGEIN_COOLDOWN_S", "1.5"))  # ignore barge-in for N s after TTS starts
 _BARGEIN_POST_TTS_GUARD_S = float(os.getenv("BARGEIN_POST_TTS_GUARD_S", "1.2"))  # guard after each TTS chunk ends
 
+# ── TTS sentence queue ────────────────────────────────────────────────
+_TTS_QUEUE_SIZE = 8  # flushed sentences buffered ahead of playback (backpressure on the LLM stream)
+
 
 # ── Globals ───────────────────────────────────────────────────────────
 sm = StateMachine()
@@ -106,16 +123,16 @@ wake: WakeDetector | None = None
 
 _loop: asyncio.AbstractEventLoop | None = None
 _conversation_history: list[dict] = []
-_mic_broadcast_task: asyncio.Task | None = None
 _converse_task: asyncio.Task | None = None
 
 # ── TTS echo suppression for STT ──────────────────────────────────────
 _TTS_ECHO_GUARD_S = float(os.getenv("TTS_ECHO_GUARD_S", "0.5"))  # suppress STT for N s after TTS stops
-_tts_echo_suppress_until: float = 0.0  # time.time() until which STT feeding is suppressed
+_TTS_ECHO_GUARD_NS = int(_TTS_ECHO_GUARD_S * 1e9)
+_tts_echo_suppress_until: int = 0  # time.monotonic_ns() until which STT feeding is suppressed
 
 # ── Barge-in state ────────────────────────────────────────────────────
 _bargein_high_frames: int = 0          # consecutive frames above threshold
-_bargein_speaking_since: float = 0.0   # time.time() when SPEAKING started
+_bargein_speaking_since: float = 0.0   # time.monotonic() when SPEAKING started
 _bargein_triggered: bool = False       # prevent re-trigger in same SPEAKING session
 _bargein_tts_was_playing: bool = False  # track TTS playing → stopped transitions
 _bargein_tts_stopped_at: float = 0.0   # when the last TTS chunk stopped
@@ -125,31 +142,46 @@ _bargein_tts_stopped_at: float = 0.0   # when the last TTS chunk stopped
 #  Logging handler that forwards log records → WS hub
 # ═══════════════════════════════════════════════════════════════════════
 class _WSLogHandler(logging.Handler):
-    """Captures Python log records and pushes them to the WebSocket hub."""
+    """Captures Python log records and pushes them to the WebSocket hub.
+
+    ``emit`` may run on any thread (audio capture, STT, wake), so it only
+    hands the raw record to the event loop; formatting and broadcasting
+    happen in a consumer task on the loop thread.
+    """
 
     def __init__(self, hub_ref: WSHub):
         super().__init__(level=logging.DEBUG)
         self._hub = hub_ref
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[logging.LogRecord] | None = None
+        self._consumer_task: asyncio.Task | None = None
 
     def set_loop(self, loop: asyncio.AbstractEventLoop):
+        """Bind to the running loop and start the log consumer task."""
         self._loop = loop
+        self._queue = asyncio.Queue()
+        self._consumer_task = loop.create_task(self._consume())
 
     def emit(self, record: logging.LogRecord):
-        if self._loop is None or self._loop.is_closed():
+        if self._loop is None or self._queue is None or self._loop.is_closed():
             return
         # Avoid feedback loops for the WS hub's own logger
-        if "WS client" in record.getMessage():
+        if "WS client" in str(record.msg):
             return
         try:
-            msg = self.format(record)
-            asyncio.run_coroutine_threadsafe(
-                self._hub.send_log(record.levelname, msg, source=record.name),
-                self._loop,
-            )
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, record)
         except Exception:
             pass  # never block the logger
 
+    async def _consume(self):
+        while True:
+            record = await self._queue.get()
+            try:
+                msg = self.format(record)
+                await self._hub.send_log(record.levelname, msg, source=record.name)
+            except Exception:
+                pass
+
 
 _ws_log_handler = _WSLogHandler(hub)
 _ws_log_handler.setFormatter(logging.Formatter("%(asctime)s [%(name)s] %(levelname)s  %(message)s", datefmt="%H:%M:%S"))
@@ -158,7 +190,7 @@ _ws_log_handler.setFormatter(logging.Formatter("%(asctime)s [%(name)s] %(levelna
 # ═══════════════════════════════════════════════════════════════════════
 #  FastAPI application
 # ═══════════════════════════════════════════════════════════════════════
-app = FastAPI(title="Lieutenant Voice Daemon")
+app = FastAPI(title="Lieutenant Voice Daemon", default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -173,7 +205,7 @@ async def ws_endpoint(websocket: WebSocket):
     await hub.connect(websocket)
     try:
         # Send current state + log history
-        await websocket.send_json({"type": "state", "value": sm.state.value, "ts": time.time()})
+        await hub.send_state(sm.state.value, websocket)
         await hub.send_log_history(websocket)
         while True:
             data = await websocket.receive_text()
@@ -191,28 +223,28 @@ async def ctrl_wake():
     """Simulate wake word trigger."""
     logger.info("Manual wake trigger via /control/wake")
     await _on_wake()
-    return JSONResponse({"ok": True, "state": sm.state.value})
+    return ORJSONResponse({"ok": True, "state": sm.state.value})
 
 
 @app.post("/control/stop")
 async def ctrl_stop():
     """Kill switch — stop everything and return to IDLE."""
     await _kill_switch()
-    return JSONResponse({"ok": True, "state": "IDLE"})
+    return ORJSONResponse({"ok": True, "state": "IDLE"})
 
 
 @app.post("/control/push_to_talk/start")
 async def ctrl_ptt_start():
     if sm.state == State.IDLE:
         await _on_wake()
-    return JSONResponse({"ok": True, "state": sm.state.value})
+    return ORJSONResponse({"ok": True, "state": sm.state.value})
 
 
 @app.post("/control/push_to_talk/stop")
 async def ctrl_ptt_stop():
     if sm.state == State.LISTENING:
         stt.stop_utterance()
-    return JSONResponse({"ok": True, "state": sm.state.value})
+    return ORJSONResponse({"ok": True, "state": sm.state.value})
 
 
 class LanguageRequest(BaseModel):
@@ -221,7 +253,7 @@ class LanguageRequest(BaseModel):
 
 @app.get("/control/language")
 async def get_language():
-    return JSONResponse({"language": _current_language})
+    return ORJSONResponse({"language": _current_language})
 
 
 @app.post("/control/language")
@@ -246,7 +278,7 @@ async def set_language(body: LanguageRequest):
 
     logger.info("Language switched to: %s", lang)
     await hub.broadcast({"type": "language", "value": lang, "ts": time.time()})
-    return JSONResponse({"ok": True, "language": lang})
+    return ORJSONResponse({"ok": True, "language": lang})
 
 
 # ── Settings endpoints (wake words + display name) ────────────────────
@@ -258,7 +290,7 @@ class SettingsRequest(BaseModel):
 
 @app.get("/control/settings")
 async def get_settings():
-    return JSONResponse({
+    return ORJSONResponse({
         "wake_phrase_el": _WAKE_PHRASES["el"],
         "wake_phrase_en": _WAKE_PHRASES["en"],
         "display_name": _DISPLAY_NAME,
@@ -303,7 +335,7 @@ async def set_settings(body: SettingsRequest):
         "ts": time.time(),
     })
 
-    return JSONResponse({
+    return ORJSONResponse({
         "ok": True,
         "wake_phrase_el": _WAKE_PHRASES["el"],
         "wake_phrase_en": _WAKE_PHRASES["en"],
@@ -358,6 +390,12 @@ async def status():
 # ═══════════════════════════════════════════════════════════════════════
 #  Core lifecycle — with conversation mode
 # ═══════════════════════════════════════════════════════════════════════
+async def _set_state(new_state: State):
+    """Transition the state machine and broadcast the new state in one frame."""
+    await sm.transition(new_state)
+    await hub.send_state(new_state.value)
+
+
 async def _on_wake():
     """Called when wake phrase is detected or conversation triggers re-listen."""
     global _converse_task
@@ -370,8 +408,7 @@ async def _on_wake():
     if sm.state == State.CONVERSING:
         # Already in conversation mode — go straight to listening
         logger.info("Conversation mode: continuing to listen (no wake needed).")
-        await sm.transition(State.LISTENING)
-        await hub.send_state(State.LISTENING.value)
+        await _set_state(State.LISTENING)
         await _start_listening()
         return
 
@@ -380,8 +417,7 @@ async def _on_wake():
             logger.info("Barge-in detected! Stopping TTS.")
             if tts:
                 tts.cancel()
-            await sm.transition(State.LISTENING)
-            await hub.send_state(State.LISTENING.value)
+            await _set_state(State.LISTENING)
             await _start_listening()
             return
         return
@@ -391,8 +427,7 @@ async def _on_wake():
     if wake:
         wake.enabled = False
 
-    await sm.transition(State.LISTENING)
-    await hub.send_state(State.LISTENING.value)
+    await _set_state(State.LISTENING)
 
     if tts:
         ack = _ACK_PHRASES.get(_current_language, "Διατάξτε")
@@ -430,7 +465,7 @@ async def _start_listening():
 
 async def _process_stt():
     final_text = ""
-    listen_start = time.time()
+    listen_start = time.monotonic()
     MAX_LISTEN_SECONDS = 30
 
     try:
@@ -438,7 +473,7 @@ async def _process_stt():
             if sm.state != State.LISTENING:
                 break
 
-            if time.time() - listen_start > MAX_LISTEN_SECONDS:
+            if time.monotonic() - listen_start > MAX_LISTEN_SECONDS:
                 logger.info("Max listen time reached (%ds), ending.", MAX_LISTEN_SECONDS)
                 stt.stop_utterance()
                 break
@@ -501,12 +536,10 @@ async def _process_stt():
         # If we were in conversation mode, return to IDLE (user stayed silent)
         if wake:
             wake.enabled = True
-        await sm.transition(State.IDLE)
-        await hub.send_state(State.IDLE.value)
+        await _set_state(State.IDLE)
         return
 
-    await sm.transition(State.THINKING)
-    await hub.send_state(State.THINKING.value)
+    await _set_state(State.THINKING)
     await _query_agent(final_text)
 
 
@@ -518,7 +551,10 @@ async def _query_agent(text: str):
     full_response = ""
     tts_buffer = ""
     first_chunk = True
-    tts_task: asyncio.Task | None = None
+    # Flushed sentences go through a bounded queue to a single TTS consumer,
+    # so the token stream keeps flowing while a sentence is being spoken.
+    tts_queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=_TTS_QUEUE_SIZE)
+    tts_consumer: asyncio.Task | None = None
 
     try:
         async for token in stream_agent_response(text, _conversation_history.copy()):
@@ -530,31 +566,30 @@ async def _query_agent(text: str):
             await hub.send_agent_chunk(token)
 
             if first_chunk:
-                await sm.transition(State.SPEAKING)
-                await hub.send_state(State.SPEAKING.value)
+                await _set_state(State.SPEAKING)
                 _reset_bargein()
                 first_chunk = False
+                if tts:
+                    tts_consumer = asyncio.create_task(_tts_consumer(tts_queue))
 
             flushed = _should_flush_tts(tts_buffer)
             if flushed is not None:
                 tts_buffer = ""
-                if tts and flushed:
-                    if tts_task and not tts_task.done():
-                        await tts_task
-                    tts_task = asyncio.create_task(_speak_sentence(flushed))
+                if tts_consumer and flushed:
+                    await tts_queue.put(flushed)
 
-        if tts_buffer.strip() and tts and sm.state == State.SPEAKING:
-            if tts_task and not tts_task.done():
-                await tts_task
-            tts_task = asyncio.create_task(_speak_sentence(tts_buffer.strip()))
-
-        if tts_task and not tts_task.done():
-            await tts_task
+        if tts_buffer.strip() and tts_consumer and sm.state == State.SPEAKING:
+            await tts_queue.put(tts_buffer.strip())
 
     except Exception as e:
         logger.error("Agent query error: %s", e)
         await hub.send_error(str(e))
 
+    # Let the consumer finish whatever is queued, then stop it
+    if tts_consumer:
+        await tts_queue.put(None)
+        await tts_consumer
+
     await hub.send_agent_done()
 
     # ── Broadcast which LLM backend was used ──────────────────────────
@@ -573,8 +608,7 @@ async def _query_agent(text: str):
     else:
         if wake:
             wake.enabled = True
-        await sm.transition(State.IDLE)
-        await hub.send_state(State.IDLE.value)
+        await _set_state(State.IDLE)
 
 
 async def _enter_converse_mode():
@@ -586,8 +620,7 @@ async def _enter_converse_mode():
     global _converse_task
 
     logger.info("Entering conversation mode (%.1fs timeout)…", _CONVERSE_TIMEOUT)
-    await sm.transition(State.CONVERSING)
-    await hub.send_state(State.CONVERSING.value)
+    await _set_state(State.CONVERSING)
 
     # Keep wake word disabled during conversation window
     if wake:
@@ -603,21 +636,27 @@ async def _converse_listen():
 
     stt.start_utterance(_loop, language=_current_language)
 
-    # Wait for either speech or timeout
-    deadline = time.time() + _CONVERSE_TIMEOUT
+    # Wait for either speech or timeout. Until speech starts, each wait is
+    # bounded by the remaining time so the loop wakes exactly at the deadline.
+    deadline = time.monotonic() + _CONVERSE_TIMEOUT
     got_speech = False
+    results = stt.results().__aiter__()
 
     try:
-        async for result in stt.results():
-            if sm.state != State.CONVERSING:
+        while True:
+            timeout = None if stt.speech_was_detected else max(0.0, deadline - time.monotonic())
+            try:
+                result = await asyncio.wait_for(results.__anext__(), timeout=timeout)
+            except StopAsyncIteration:
                 break
-
-            # Check if timeout exceeded without speech
-            if not stt.speech_was_detected and time.time() > deadline:
+            except asyncio.TimeoutError:
                 logger.info("Conversation timeout — no follow-up speech. Returning to IDLE.")
                 stt.stop_utterance()
                 break
 
+            if sm.state != State.CONVERSING:
+                break
+
             # If silence detected after speech, end listening
             if stt.silence_detected:
                 logger.info("Silence after follow-up speech, processing…")
@@ -641,8 +680,7 @@ async def _converse_listen():
                 if stt.speech_was_detected:
                     got_speech = True
                     # Once speech starts, switch to full LISTENING mode
-                    await sm.transition(State.LISTENING)
-                    await hub.send_state(State.LISTENING.value)
+                    await _set_state(State.LISTENING)
                     # Continue processing in the normal STT flow
                     await _process_stt_continuation()
                     return
@@ -663,22 +701,20 @@ async def _converse_listen():
             pass
 
         if final_text and final_text.strip() not in ("", "(no speech detected)", "(no speech)"):
-            await sm.transition(State.THINKING)
-            await hub.send_state(State.THINKING.value)
+            await _set_state(State.THINKING)
             await _query_agent(final_text)
             return
 
     # No speech or empty — back to IDLE
     if wake:
         wake.enabled = True
-    await sm.transition(State.IDLE)
-    await hub.send_state(State.IDLE.value)
+    await _set_state(State.IDLE)
 
 
 async def _process_stt_continuation():
     """Continue processing STT after detecting speech in CONVERSING mode."""
     final_text = ""
-    listen_start = time.time()
+    listen_start = time.monotonic()
     MAX_LISTEN_SECONDS = 30
 
     try:
@@ -686,7 +722,7 @@ async def _process_stt_continuation():
             if sm.state != State.LISTENING:
                 break
 
-            if time.time() - listen_start > MAX_LISTEN_SECONDS:
+            if time.monotonic() - listen_start > MAX_LISTEN_SECONDS:
                 stt.stop_utterance()
                 break
 
@@ -722,15 +758,25 @@ async def _process_stt_continuation():
     if not final_text or final_text.strip() in ("", "(no speech detected)", "(no speech)", "(STT unavailable)"):
         if wake:
             wake.enabled = True
-        await sm.transition(State.IDLE)
-        await hub.send_state(State.IDLE.value)
+        await _set_state(State.IDLE)
         return
 
-    await sm.transition(State.THINKING)
-    await hub.send_state(State.THINKING.value)
+    await _set_state(State.THINKING)
     await _query_agent(final_text)
 
 
+async def _tts_consumer(queue: asyncio.Queue[str | None]):
+    """Speak queued sentences in order until the None sentinel arrives."""
+    while True:
+        text = await queue.get()
+        if text is None:
+            return
+        try:
+            await _speak_sentence(text)
+        except Exception as e:
+            logger.error("TTS consumer error: %s", e)
+
+
 async def _speak_sentence(text: str):
     if tts and sm.state == State.SPEAKING:
         clean = _clean_for_tts(text)
@@ -745,7 +791,7 @@ def _should_flush_tts(buffer: str) -> str | None:
     """
     stripped = buffer.strip()
     # Never flush a bare list marker like "1." or "2)" with no real sentence
-    if _re.match(r'^\d+[.)\s]*$', stripped):
+    if len(stripped) <= 4 and stripped[:1].isdigit() and _LIST_MARKER_RE.match(stripped):
         return None
     # Need some minimum content before flushing on punctuation
     if len(stripped) < 20:
@@ -764,7 +810,7 @@ def _reset_bargein():
     global _bargein_high_frames, _bargein_speaking_since, _bargein_triggered
     global _bargein_tts_was_playing, _bargein_tts_stopped_at
     _bargein_high_frames = 0
-    _bargein_speaking_since = time.time()
+    _bargein_speaking_since = time.monotonic()
     _bargein_triggered = False
     _bargein_tts_was_playing = False
     _bargein_tts_stopped_at = 0.0
@@ -790,8 +836,10 @@ def _check_bargein(audio):
     if _bargein_triggered:
         return
 
+    now = time.monotonic()
+
     # Cooldown: ignore the very start of SPEAKING
-    if time.time() - _bargein_speaking_since < _BARGEIN_COOLDOWN_S:
+    if now - _bargein_speaking_since < _BARGEIN_COOLDOWN_S:
         _bargein_high_frames = 0
         return
 
@@ -806,11 +854,11 @@ def _check_bargein(audio):
     # TTS just stopped — record when and measure ambient noise for baseline
     if _bargein_tts_was_playing and not tts_playing:
         _bargein_tts_was_playing = False
-        _bargein_tts_stopped_at = time.time()
+        _bargein_tts_stopped_at = now
         _bargein_high_frames = 0
 
     # Guard period after TTS stops — let echo fully decay from speakers + room
-    elapsed_since_tts = time.time() - _bargein_tts_stopped_at if _bargein_tts_stopped_at > 0 else 999.0
+    elapsed_since_tts = now - _bargein_tts_stopped_at if _bargein_tts_stopped_at > 0 else 999.0
     if elapsed_since_tts < _BARGEIN_POST_TTS_GUARD_S:
         _bargein_high_frames = 0
         return
@@ -846,33 +894,74 @@ async def _kill_switch():
     if wake:
         wake.enabled = True
     _conversation_history.clear()
-    await sm.transition(State.IDLE)
-    await hub.send_state(State.IDLE.value)
+    await _set_state(State.IDLE)
 
 
 # ── Mic level broadcasting ────────────────────────────────────────────
-async def _broadcast_mic_levels():
-    while True:
-        try:
-            if hub.client_count > 0:
-                rms = capture.rms
-                # Always broadcast mic RMS — the waveform uses it in all states
-                await hub.send_mic_level(rms)
-            await asyncio.sleep(0.05)
-        except Exception:
-            await asyncio.sleep(0.1)
+# Pushed from the capture thread as frames arrive, coalesced to ≤ 20 Hz.
+_MIC_LEVEL_INTERVAL_S = 0.05
+_MIC_LEVEL_DEADBAND = 0.002   # skip sends that wouldn't visibly move the waveform
+_MIC_LEVEL_KEEPALIVE_S = 1.0  # …but resend at least this often
+_mic_level_last_tx = 0.0
+_mic_level_last_rms = -1.0
+_mic_level_tasks: set[asyncio.Task] = set()  # held until done, so none is collected mid-send
+
+
+def _push_mic_level(rms: float):
+    """Capture thread: schedule a mic.level broadcast if one is due."""
+    global _mic_level_last_tx, _mic_level_last_rms
+    if _loop is None or hub.client_count == 0:
+        return
+    now = time.monotonic()
+    since = now - _mic_level_last_tx
+    if since < _MIC_LEVEL_INTERVAL_S:
+        return
+    # Always broadcast mic RMS — the waveform uses it in all states
+    if abs(rms - _mic_level_last_rms) < _MIC_LEVEL_DEADBAND and since < _MIC_LEVEL_KEEPALIVE_S:
+        return
+    _mic_level_last_tx = now
+    _mic_level_last_rms = rms
+    _loop.call_soon_threadsafe(_start_mic_level_send, rms)
+
+
+def _start_mic_level_send(rms: float):
+    """Loop thread: create the mic.level send here and keep it until it completes."""
+    task = _loop.create_task(hub.send_mic_level(rms))
+    _mic_level_tasks.add(task)
+    task.add_done_callback(_mic_level_sent)
+
+
+def _mic_level_sent(task: asyncio.Task):
+    _mic_level_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("mic.level send failed: %s", task.exception())
+
+
+_tts_level_pending = False  # a tts.level send is already scheduled on the loop
+
+
+async def _send_tts_level(rms: float):
+    global _tts_level_pending
+    try:
+        await hub.send_tts_level(rms)
+    finally:
+        _tts_level_pending = False
 
 
 def _tts_rms_callback(rms: float):
-    if _loop and hub.client_count > 0:
-        asyncio.run_coroutine_threadsafe(hub.send_tts_level(rms), _loop)
+    global _tts_level_pending
+    # Coalesce bursts: while one level frame is in flight, newer ones are
+    # dropped — except the closing 0.0, which must reach the waveform.
+    if _loop and hub.client_count > 0 and (rms == 0.0 or not _tts_level_pending):
+        _tts_level_pending = True
+        asyncio.run_coroutine_threadsafe(_send_tts_level(rms), _loop)
 
 
 # ═══════════════════════════════════════════════════════════════════════
 #  Main entry
 # ═══════════════════════════════════════════════════════════════════════
 async def run_server(port: int = 8765):
-    global tts, wake, _loop, _mic_broadcast_task
+    global tts, wake, _loop
 
     _loop = asyncio.get_event_loop()
 
@@ -897,16 +986,19 @@ async def run_server(port: int = 8765):
 
     # Wire audio capture → wake + STT + barge-in
     def _audio_frame_handler(audio):
+        # `audio` views PortAudio's buffer: use or copy it here, never keep it past return
         global _tts_echo_suppress_until
         wake.feed_audio(audio)
+        _push_mic_level(capture.rms)  # capture sets rms before calling handlers
 
         # ── TTS echo suppression ────────────────────────────────────
         # Don't feed mic audio to STT while TTS is playing (or just
         # finished) — prevents the ack / response from being
         # transcribed as user speech.
+        now_ns = time.monotonic_ns()
         if tts and tts.is_playing:
-            _tts_echo_suppress_until = time.time() + _TTS_ECHO_GUARD_S
-        elif time.time() < _tts_echo_suppress_until:
+            _tts_echo_suppress_until = now_ns + _TTS_ECHO_GUARD_NS
+        elif now_ns < _tts_echo_suppress_until:
             pass  # still in post-TTS echo guard — skip STT feed
         else:
             stt.feed_audio(audio)
@@ -917,12 +1009,6 @@ async def run_server(port: int = 8765):
 
     capture.on_frame(_audio_frame_handler)
 
-    # State change listener
-    async def _on_state_change(state: State):
-        await hub.send_state(state.value)
-
-    sm.on_change(_on_state_change)
-
     # Start components
     capture.start()
     logger.info("Audio capture thread launched")
@@ -937,8 +1023,6 @@ async def run_server(port: int = 8765):
     else:
         logger.error("Mic NOT healthy after 1.5 s — errors: %s", capture.errors)
 
-    _mic_broadcast_task = asyncio.create_task(_broadcast_mic_levels())
-
     logger.info("Voice daemon ready on port %d", port)
 
     config = uvicorn.Config(
@@ -25,7 +25,6 @@ class StateMachine:
     def __init__(self):
         self._state = State.IDLE
         self._listeners: list[Callable[[State], Awaitable[None]]] = []
-        self._lock = asyncio.Lock()
 
     @property
     def state(self) -> State:
@@ -35,17 +34,21 @@ class StateMachine:
         self._listeners.append(callback)
 
     async def transition(self, new_state: State):
-        async with self._lock:
-            old = self._state
-            if old == new_state:
-                return
-            self._state = new_state
-            logger.info("State: %s -> %s", old.value, new_state.value)
-            for cb in self._listeners:
-                try:
-                    await cb(new_state)
-                except Exception as e:
-                    logger.error("State listener error: %s", e)
+        # The check-and-set runs before the first await, so it is atomic on
+        # the event loop without a lock; listeners are notified concurrently.
+        old = self._state
+        if old == new_state:
+            return
+        self._state = new_state
+        logger.info("State: %s -> %s", old.value, new_state.value)
+        if not self._listeners:
+            return
+        results = await asyncio.gather(
+            *(cb(new_state) for cb in self._listeners), return_exceptions=True,
+        )
+        for r in results:
+            if isinstance(r, Exception):
+                logger.error("State listener error: %s", r)
 
     async def reset(self):
         await self.transition(State.IDLE)
@@ -3,26 +3,77 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
-import queue
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from typing import AsyncIterator, Callable, Awaitable
 
 import numpy as np
+import orjson
+
+from lieutenant_daemon.audio_capture import BLOCK_SIZE
 
 logger = logging.getLogger("lieutenant-daemon")
 
 SAMPLE_RATE = 16000
+_CHUNK_MS = BLOCK_SIZE * 1000 // SAMPLE_RATE  # 64 ms per capture frame
 _STT_BACKEND = os.getenv("STT_BACKEND", "local")
 _MODEL_SIZE = os.getenv("STT_MODEL_SIZE", "medium")
+_PCM_SECONDS = 17  # utterance buffer — covers the ~16 s max utterance
+_WHISPER_NUM_WORKERS = 2  # lets CTranslate2 overlap feature extraction and decoding
+_WHISPER_DEVICE = os.getenv("STT_DEVICE", "auto")            # auto | cpu | cuda
+_WHISPER_COMPUTE_TYPE = os.getenv("STT_COMPUTE_TYPE", "auto")  # auto | int8 | float16 | …
+_WHISPER_CPU_THREADS = int(os.getenv("STT_CPU_THREADS") or 0) or min(os.cpu_count() or 4, 8)
+_PARTIAL_CHUNK_S = 5      # partial windows are split into clips about this long and batched
+_CLIP_CUT_SEARCH_S = 0.5  # a clip boundary moves to the quietest 20 ms within this of its nominal spot
+_PARTIAL_BATCH_SIZE = 8
+_FINAL_BATCH_SIZE = int(os.getenv("STT_BATCH_SIZE", "8"))
+_FINAL_CHUNK_S = 10       # longer finals are split at pauses into clips about this long
+_VOSK_FEED_SAMPLES = SAMPLE_RATE * 300 // 1000  # Vosk fallback is fed in ~300 ms chunks
+_REPEAT_CHECK_WORDS = 60  # repeated-hallucination check looks at this many trailing words
+
+# ── RMS fallback detector tuning ──────────────────────────────────────
+_NOISE_CALIBRATION_FRAMES = 8
+_MIN_SPEECH_FRAMES = 3
+_SILENCE_FACTOR = 4.0
+_MIN_SILENCE_THRESHOLD = 0.002
+_SPEECH_THRESHOLD_FACTOR = 6.0
+
+# Silero VAD ONNX export — run through ONNX Runtime instead of torch when present
+_SILERO_ONNX_PATH = os.getenv("SILERO_VAD_ONNX", "")
+_SILERO_HUB_DIR = Path.home() / ".cache" / "torch" / "hub" / "snakers4_silero-vad_master"
+# WebRTC VAD stands in for Silero when neither ONNX Runtime nor torch can load it
+_WEBRTC_VAD_MODE = int(os.getenv("STT_WEBRTC_VAD_MODE", "2"))  # 0 (lenient) … 3 (aggressive)
+_WEBRTC_FRAME = SAMPLE_RATE * 20 // 1000  # 20 ms sub-frames (webrtcvad takes 10/20/30 ms)
 
 # NOTE: Do NOT use initial_prompt — it causes Whisper to hallucinate the prompt
 # text itself on silence/quiet audio. language="el" is sufficient to force Greek.
 
 
+# ── Per-frame kernel: int16 → float32, peak and sum of squares in one pass ──
+try:
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _frame_stats(x_i16, out_f32):
+        inv = np.float32(1.0 / 32768.0)
+        peak = np.float32(0.0)
+        ss = 0.0
+        for i in range(x_i16.shape[0]):
+            v = np.float32(x_i16[i]) * inv
+            out_f32[i] = v
+            peak = max(peak, abs(v))
+            ss += v * v
+        return float(peak), ss
+except ImportError:
+    def _frame_stats(x_i16, out_f32):
+        np.multiply(x_i16, np.float32(1.0 / 32768.0), out=out_f32)
+        return float(np.abs(out_f32).max()), float(np.dot(out_f32, out_f32))
+
+
 class STTResult:
     """Represents a partial or final STT result."""
     def __init__(self, text: str, is_final: bool = False):
@@ -30,6 +81,216 @@ class STTResult:
         self.is_final = is_final
 
 
+def _find_silero_onnx() -> str:
+    """Locate silero_vad.onnx: $SILERO_VAD_ONNX, models/, then the torch hub checkout."""
+    if _SILERO_ONNX_PATH:
+        return _SILERO_ONNX_PATH
+    local = Path(__file__).resolve().parent.parent / "models" / "silero_vad.onnx"
+    if local.exists():
+        return str(local)
+    if _SILERO_HUB_DIR.exists():
+        for candidate in _SILERO_HUB_DIR.rglob("silero_vad.onnx"):
+            return str(candidate)
+    return ""
+
+
+class _SileroOnnx:
+    """Silero VAD on ONNX Runtime — recurrent state kept as numpy arrays.
+
+    Handles both exports: v4 (``h``/``c`` inputs, any supported chunk size)
+    and v5 (single ``state`` input, 512-sample windows with 64 samples of
+    left context at 16 kHz).
+    """
+
+    _V5_WINDOW = 512
+    _V5_CONTEXT = 64
+
+    def __init__(self, path: str):
+        import onnxruntime as ort
+
+        opts = ort.SessionOptions()
+        opts.intra_op_num_threads = 1
+        opts.inter_op_num_threads = 1
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self._session = ort.InferenceSession(path, sess_options=opts, providers=["CPUExecutionProvider"])
+        self._v5 = "state" in {i.name for i in self._session.get_inputs()}
+        self._sr = np.array(SAMPLE_RATE, dtype=np.int64)
+        self.reset_states()
+
+    def reset_states(self):
+        if self._v5:
+            self._state = np.zeros((2, 1, 128), dtype=np.float32)
+            # Reused model input: [64 samples of context | 512-sample window]
+            self._x = np.zeros((1, self._V5_CONTEXT + self._V5_WINDOW), dtype=np.float32)
+        else:
+            self._h = np.zeros((2, 1, 64), dtype=np.float32)
+            self._c = np.zeros((2, 1, 64), dtype=np.float32)
+
+    def __call__(self, audio_f32: np.ndarray) -> float:
+        """Return the speech probability for one float32 frame."""
+        if not self._v5:
+            out, self._h, self._c = self._session.run(
+                None, {"input": audio_f32[None, :], "sr": self._sr, "h": self._h, "c": self._c},
+            )
+            return float(out[0, 0])
+
+        x = self._x
+        ctx = self._V5_CONTEXT
+        feed = {"input": x, "state": self._state, "sr": self._sr}
+        prob = 0.0
+        for i in range(0, len(audio_f32), self._V5_WINDOW):
+            window = audio_f32[i:i + self._V5_WINDOW]
+            if len(window) < self._V5_WINDOW:
+                break  # v5 only accepts full windows
+            x[0, ctx:] = window
+            out, feed["state"] = self._session.run(None, feed)
+            x[0, :ctx] = x[0, -ctx:]  # this window's tail is the next one's context
+            prob = max(prob, float(out[0, 0]))
+        self._state = feed["state"]
+        return prob
+
+
+def _repeated_tail_start(words: list[str]) -> int | None:
+    """Index where the (last ≤ 60) words start if they are one phrase said
+    twice — a Whisper loop — else None. Words before it are kept."""
+    start = max(len(words) - _REPEAT_CHECK_WORDS, 0)
+    tail = words[start:]
+    if len(tail) < 6:
+        return None
+    half = len(tail) // 2
+    # First-word check rejects almost every real transcript without slicing;
+    # the slice compare then stops at the first differing word.
+    if tail[0] == tail[half] and tail[:half] == tail[half:2 * half]:
+        return start
+    return None
+
+
+def _load_whisper_model():
+    """Build the faster-whisper model (local models/whisper-<size> dir if present)."""
+    from faster_whisper import WhisperModel
+
+    local_model = Path(__file__).parent.parent / "models" / f"whisper-{_MODEL_SIZE}"
+    if local_model.exists():
+        logger.info("Pre-loading local whisper model from %s…", local_model)
+        source = str(local_model)
+    else:
+        logger.info("Pre-loading faster-whisper '%s' (first time may download ~1.5 GB)…", _MODEL_SIZE)
+        source = _MODEL_SIZE
+    device, compute_type = _whisper_device()
+    logger.info("faster-whisper on %s (%s, %d CPU threads)", device, compute_type, _WHISPER_CPU_THREADS)
+    return WhisperModel(source, device=device, compute_type=compute_type,
+                        cpu_threads=_WHISPER_CPU_THREADS, num_workers=_WHISPER_NUM_WORKERS)
+
+
+def _whisper_device() -> tuple[str, str]:
+    """Resolve STT_DEVICE / STT_COMPUTE_TYPE, picking from what CTranslate2 supports."""
+    device, compute_type = _WHISPER_DEVICE, _WHISPER_COMPUTE_TYPE
+    try:
+        import ctranslate2
+    except ImportError:
+        return ("cpu" if device == "auto" else device), ("int8" if compute_type == "auto" else compute_type)
+    if device == "auto":
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    if compute_type == "auto":
+        supported = ctranslate2.get_supported_compute_types(device)
+        preferred = ("float16", "int8_float16") if device == "cuda" else ("int8", "int8_float32")
+        compute_type = next((c for c in preferred if c in supported), "default")
+    return device, compute_type
+
+
+def _load_batched_pipeline(model):
+    """Wrap the model in BatchedInferencePipeline (faster-whisper ≥ 1.2), or None."""
+    try:
+        from faster_whisper import BatchedInferencePipeline, __version__
+    except ImportError:
+        logger.info("BatchedInferencePipeline unavailable — using sequential decode.")
+        return None
+    # 1.1.x reads clip_timestamps as sample indices; we pass seconds (1.2+)
+    if tuple(int(x) for x in __version__.split(".")[:2]) < (1, 2):
+        logger.info("faster-whisper %s predates second-based clips — using sequential decode.", __version__)
+        return None
+    return BatchedInferencePipeline(model=model)
+
+
+def _clips_at_pauses(audio: np.ndarray, chunk_s: float) -> list[dict]:
+    """Split audio into ~chunk_s clips (in seconds), cutting at the quietest
+    20 ms near each boundary so a word isn't split between two clips."""
+    n = len(audio)
+    step = int(chunk_s * SAMPLE_RATE)
+    search = int(_CLIP_CUT_SEARCH_S * SAMPLE_RATE)
+    hop = SAMPLE_RATE // 50
+    cuts = [0]
+    nominal = step
+    while n - nominal > search:
+        lo = max(cuts[-1] + hop, nominal - search)
+        frames = audio[lo:nominal + search]
+        frames = frames[:len(frames) - len(frames) % hop].reshape(-1, hop)
+        quiet = int(np.argmin(np.einsum("ij,ij->i", frames, frames)))
+        cut = lo + quiet * hop + hop // 2
+        cuts.append(cut)
+        nominal = cut + step
+    cuts.append(n)
+    return [{"start": a / SAMPLE_RATE, "end": b / SAMPLE_RATE} for a, b in zip(cuts, cuts[1:])]
+
+
+class _WebRtcVad:
+    """WebRTC VAD behind the Silero call interface.
+
+    Scores a capture frame as the fraction of its 20 ms sub-frames judged
+    voiced; the trailing remainder (64 samples of a 1024 block) is skipped.
+    """
+
+    def __init__(self):
+        import webrtcvad
+
+        self._vad = webrtcvad.Vad(_WEBRTC_VAD_MODE)
+        self._scaled = np.empty(BLOCK_SIZE, dtype=np.float32)
+        self._pcm16 = np.empty(BLOCK_SIZE, dtype=np.int16)
+
+    def reset_states(self):
+        pass  # stateless between frames
+
+    def __call__(self, audio_f32: np.ndarray) -> float:
+        """Return the voiced fraction for one float32 frame (un-gained: WebRTC is level-sensitive)."""
+        n = len(audio_f32) - len(audio_f32) % _WEBRTC_FRAME
+        if n == 0:
+            return 0.0
+        scaled = self._scaled[:n]
+        np.multiply(audio_f32[:n], 32767.0, out=scaled)
+        np.clip(scaled, -32768.0, 32767.0, out=scaled)
+        pcm16 = self._pcm16[:n]
+        pcm16[:] = scaled
+        data = memoryview(pcm16).cast("B")
+        step = _WEBRTC_FRAME * 2
+        is_speech = self._vad.is_speech
+        voiced = 0
+        for i in range(0, len(data), step):
+            voiced += is_speech(data[i:i + step], SAMPLE_RATE)
+        return voiced / (n // _WEBRTC_FRAME)
+
+
+class _Utterance:
+    """One utterance's audio buffer and capture → transcriber signals.
+
+    Each transcriber thread holds its own, so a thread still finishing the
+    previous utterance never reads the next one's length or misses its stop.
+    Single producer (feed_audio) / single consumer: samples are written
+    before ``length`` (a plain int store) is published and ``ready`` set.
+    """
+
+    __slots__ = ("pcm", "length", "ready", "stopped")
+
+    def __init__(self, samples: int):
+        self.pcm = np.empty(samples, dtype=np.float32)
+        self.length = 0
+        self.ready = threading.Event()
+        self.stopped = threading.Event()
+
+    def stop(self):
+        self.stopped.set()
+        self.ready.set()  # wake the transcriber immediately
+
+
 class STTEngine:
     """
     Streaming STT using faster-whisper (medium model) for best Greek quality.
@@ -38,36 +299,49 @@ class STTEngine:
     """
 
     def __init__(self):
-        self._audio_buffer: list[np.ndarray] = []
-        self._audio_queue: queue.Queue[np.ndarray | None] = queue.Queue()
+        self._utt = _Utterance(0)  # current utterance, filled by feed_audio
         self._active = False
         self._result_queue: asyncio.Queue[STTResult] = asyncio.Queue()
         self._thread: threading.Thread | None = None
         self._backend = "none"
         self._model = None  # cached whisper model
-        self._vad_model = None  # Silero VAD model
+        self._vosk_model = None  # cached Vosk model (fallback backend)
+        # Utterance threads can overlap (one finishing its final as the next
+        # starts); the lock keeps a lazy load from happening twice.
+        self._model_lock = threading.Lock()
+        self._batched = None  # BatchedInferencePipeline over _model (partials)
+        # Partials decode here so the transcriber keeps reading audio meanwhile;
+        # with num_workers=2 CTranslate2 runs a partial and the final side by side.
+        self._partial_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt-partial")
+        self._partial_gain_f32 = np.empty(SAMPLE_RATE * _PCM_SECONDS, dtype=np.float32)  # pool worker only
+        self._vad_model = None  # Silero VAD model (_SileroOnnx, torch module) or _WebRtcVad
+        self._vad_torch = False  # True when _vad_model is the torch module
 
         # ── Silero VAD state ──────────────────────────────────────────
         self._vad_triggered = False   # True once VAD detected speech
         self._vad_silence_ms = 0      # consecutive silence milliseconds
         self._vad_speech_ms = 0       # total speech milliseconds
-        self._VAD_SILENCE_THRESHOLD_MS = 800   # 0.8s silence after speech → end (snappy)
+        self._VAD_SILENCE_THRESHOLD_MS = int(os.getenv("STT_END_SILENCE_MS", "600"))  # silence after speech → end
         self._VAD_MIN_SPEECH_MS = 150          # require ≥150ms speech
         self._VAD_PROB_THRESHOLD = 0.25        # Lowered from 0.5 — laptop mics are quiet
+        # Pre-onset energy gate: skip Silero on frames near the noise floor.
+        # The floor persists across utterances — the room doesn't change between them.
+        self._vad_noise_energy = 0.0           # EMA of sum-of-squares on non-speech frames
+        self._VAD_NOISE_ALPHA = 0.01
+        self._VAD_GATE_FACTOR = 2.0            # ~3 dB above the floor wakes Silero
 
         # ── RMS fallback state (when Silero unavailable) ──────────────
         self._silence_frames = 0
         self._max_silence = 15             # ~1s at 64ms/frame (was 25)
         self._noise_floor: float = 0.0
-        self._noise_samples: list[float] = []
+        self._noise_samples = np.empty(_NOISE_CALIBRATION_FRAMES, dtype=np.float32)
+        self._noise_n = 0
         self._noise_calibrated = False
         self._speech_frames = 0
-        self._peak_rms: float = 0.0
-        self._MIN_SPEECH_FRAMES = 3
-        self._NOISE_CALIBRATION_FRAMES = 8
-        self._SILENCE_FACTOR = 4.0
-        self._MIN_SILENCE_THRESHOLD = 0.002
-        self._SPEECH_THRESHOLD_FACTOR = 6.0
+        self._peak_energy: float = 0.0
+        # Silence / speech thresholds as per-frame sums of squares, set at calibration
+        self._rms_threshold = 0.0
+        self._rms_speech_threshold = 0.0
 
         # ── Utterance limits ──────────────────────────────────────────
         self._total_frames = 0
@@ -88,7 +362,21 @@ class STTEngine:
         self._preload_whisper()
 
     def _preload_vad(self):
-        """Pre-load Silero VAD model."""
+        """Pre-load Silero VAD — ONNX Runtime if available, else torch hub."""
+        # Every frame is one capture block; _run_vad counts time in _CHUNK_MS steps
+        if BLOCK_SIZE % 512:
+            raise ValueError(f"Silero VAD needs whole 512-sample windows; BLOCK_SIZE is {BLOCK_SIZE}")
+        onnx_path = _find_silero_onnx()
+        if onnx_path:
+            try:
+                self._vad_model = _SileroOnnx(onnx_path)
+                logger.info("Silero VAD loaded on ONNX Runtime from %s.", onnx_path)
+                return
+            except ImportError:
+                logger.info("onnxruntime not installed — loading Silero VAD through torch.")
+            except Exception as e:
+                logger.warning("Silero ONNX load failed, trying torch: %s", e)
+
         try:
             import torch
             torch.set_num_threads(1)
@@ -98,24 +386,22 @@ class STTEngine:
                 trust_repo=True,
             )
             self._vad_model = model
+            self._vad_torch = True
             logger.info("Silero VAD model loaded (ML-based speech detection).")
+            return
+        except Exception as e:
+            logger.warning("Silero VAD not available, trying WebRTC VAD: %s", e)
+
+        try:
+            self._vad_model = _WebRtcVad()
+            logger.info("WebRTC VAD loaded (mode=%d).", _WEBRTC_VAD_MODE)
         except Exception as e:
-            logger.warning("Silero VAD not available, falling back to RMS: %s", e)
+            logger.warning("WebRTC VAD not available, falling back to RMS: %s", e)
 
     def _preload_whisper(self):
         """Pre-load the faster-whisper model."""
         try:
-            from faster_whisper import WhisperModel
-            import pathlib
-
-            local_model = pathlib.Path(__file__).parent.parent / "models" / f"whisper-{_MODEL_SIZE}"
-            if local_model.exists():
-                logger.info("Pre-loading local whisper model from %s…", local_model)
-                self._model = WhisperModel(str(local_model), device="cpu", compute_type="int8")
-            else:
-                logger.info("Pre-loading faster-whisper '%s' (first time may download ~1.5 GB)…", _MODEL_SIZE)
-                self._model = WhisperModel(_MODEL_SIZE, device="cpu", compute_type="int8")
-            self._backend = "faster-whisper"
+            self._whisper_model()
             logger.info("faster-whisper '%s' ready.", _MODEL_SIZE)
         except ImportError:
             logger.warning("faster-whisper not installed, will try Vosk at runtime.")
@@ -126,11 +412,14 @@ class STTEngine:
         """Begin capturing an utterance."""
         self._active = True
         self._language = language
-        self._audio_buffer.clear()
+        # Fresh buffer and signals per utterance: a transcriber thread still
+        # finishing the previous one keeps its own, already stopped.
+        self._utt.stop()
+        utt = self._utt = _Utterance(SAMPLE_RATE * _PCM_SECONDS)
         self._total_frames = 0
         self._speech_detected = False
         self._rms_speech_detected = False
-        self._listen_start_time = time.time()
+        self._listen_start_time = time.monotonic()
 
         # Reset VAD state
         self._vad_triggered = False
@@ -144,51 +433,53 @@ class STTEngine:
 
         # Reset RMS fallback state
         self._silence_frames = 0
-        self._noise_samples = []
+        self._noise_n = 0
         self._noise_calibrated = False
         self._noise_floor = 0.0
         self._speech_frames = 0
-        self._peak_rms = 0.0
+        self._peak_energy = 0.0
 
-        # Clear queues
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except queue.Empty:
-                break
-        self._result_queue = asyncio.Queue()
+        # One result queue for the engine's lifetime (asyncio.Queue binds to the
+        # running loop on first use) — just drop anything left from last time.
+        results = self._result_queue
+        while not results.empty():
+            results.get_nowait()
         self._thread = threading.Thread(
-            target=self._transcribe_loop, args=(loop,), daemon=True
+            target=self._transcribe_loop, args=(loop, utt), daemon=True
         )
         self._thread.start()
 
     def stop_utterance(self):
-        """Signal end of utterance — drain queue so transcription thread exits fast."""
+        """Signal end of utterance — the transcription thread exits without reading further audio."""
         self._active = False
-        drained = 0
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-                drained += 1
-            except queue.Empty:
-                break
-        if drained:
-            logger.info("Drained %d queued audio frames", drained)
-        self._audio_queue.put(None)  # Sentinel
+        self._utt.stop()
 
     def feed_audio(self, audio: np.ndarray):
-        """Feed audio frames during listening."""
+        """Feed audio frames during listening (consumed before returning; not retained)."""
         if not self._active:
             return
-        self._audio_buffer.append(audio.copy())
-        self._audio_queue.put(audio.copy())
+        # Convert once, straight into the utterance buffer; the detectors and
+        # the transcriber all read that same float32 data.
+        utt = self._utt
+        pcm = utt.pcm
+        w = utt.length
+        n = len(audio)
+        if w + n <= len(pcm):
+            audio_f32 = pcm[w:w + n]
+            peak, energy = _frame_stats(audio, audio_f32)
+            utt.length = w + n
+        else:
+            # Past the max utterance length — still run detection, stop buffering
+            audio_f32 = np.empty(n, dtype=np.float32)
+            peak, energy = _frame_stats(audio, audio_f32)
+        utt.ready.set()
         self._total_frames += 1
 
         # ── Speech/silence detection — use BOTH Silero + RMS ─────────────
         if self._vad_model is not None:
-            self._run_vad(audio)
+            self._run_vad(audio_f32, energy, peak)
         # Always run RMS as backup / co-signal
-        self._run_rms_vad(audio)
+        self._run_rms_vad(audio_f32, energy)
 
         # If either detector found speech, mark it
         if not self._speech_detected and self._rms_speech_detected:
@@ -196,37 +487,43 @@ class STTEngine:
             self._vad_triggered = True
             logger.info("RMS fallback promoted speech_detected (Silero missed it)")
 
-    def _run_vad(self, audio: np.ndarray):
-        """Run Silero VAD on the audio chunk.
+    def _run_vad(self, audio_f32: np.ndarray, energy: float, peak: float):
+        """Run Silero VAD on the audio chunk (float32, already scaled to [-1, 1]).
 
         Silero VAD at 16kHz accepts chunk sizes: 256, 512, 768, 1024, 1536.
         Our BLOCK_SIZE=1024, so we feed the whole frame directly.
         We also apply gain boost so quiet laptop mics register properly.
-        """
-        import torch
 
-        audio_f32 = audio.astype(np.float32) / 32768.0
+        Before onset, frames whose energy stays within ``_VAD_GATE_FACTOR`` of
+        the tracked noise floor are treated as silence without calling the
+        model. After onset Silero runs on every frame for accurate offsets.
+        """
+        if (not self._vad_triggered and self._vad_noise_energy > 0.0
+                and energy < self._vad_noise_energy * self._VAD_GATE_FACTOR):
+            self._vad_noise_energy += self._VAD_NOISE_ALPHA * (energy - self._vad_noise_energy)
+            return
 
         # ── Auto-gain: boost quiet audio so Silero can detect speech ──
-        peak = np.max(np.abs(audio_f32))
-        if peak > 0:
+        # Not for the WebRTC fallback: its decision depends on input level,
+        # so boosted room noise would read as voiced.
+        if peak > 0 and not isinstance(self._vad_model, _WebRtcVad):
             # Target peak of 0.9 but cap gain at 30x to avoid amplifying pure noise
             gain = min(0.9 / peak, 30.0)
             if gain > 1.5:  # Only boost if meaningfully quiet
                 audio_f32 = audio_f32 * gain
 
-        tensor = torch.from_numpy(audio_f32)
-
         try:
-            speech_prob = self._vad_model(tensor, SAMPLE_RATE).item()
+            if self._vad_torch:
+                import torch
+                speech_prob = self._vad_model(torch.from_numpy(audio_f32), SAMPLE_RATE).item()
+            else:
+                speech_prob = self._vad_model(audio_f32)
         except Exception as e:
-            logger.debug("Silero VAD error: %s", e)
+            logger.debug("VAD error: %s", e)
             return
 
-        chunk_ms = len(audio) * 1000 // SAMPLE_RATE  # 64ms per 1024 samples
-
         if speech_prob >= self._VAD_PROB_THRESHOLD:
-            self._vad_speech_ms += chunk_ms
+            self._vad_speech_ms += _CHUNK_MS
             self._vad_silence_ms = 0
             if not self._speech_detected and self._vad_speech_ms >= self._VAD_MIN_SPEECH_MS:
                 self._speech_detected = True
@@ -235,36 +532,51 @@ class STTEngine:
                             speech_prob, self._vad_speech_ms)
         else:
             if self._vad_triggered:
-                self._vad_silence_ms += chunk_ms
+                self._vad_silence_ms += _CHUNK_MS
+            # Track the noise floor from non-speech frames (gated ones included above)
+            if self._vad_noise_energy == 0.0:
+                self._vad_noise_energy = energy
+            else:
+                self._vad_noise_energy += self._VAD_NOISE_ALPHA * (energy - self._vad_noise_energy)
 
-    def _run_rms_vad(self, audio: np.ndarray):
-        """RMS energy-based speech detection — always runs alongside Silero."""
-        rms = float(np.sqrt(np.mean((audio.astype(np.float32) / 32768.0) ** 2)))
+    def _run_rms_vad(self, audio_f32: np.ndarray, energy: float):
+        """RMS energy-based speech detection — always runs alongside Silero.
 
+        After calibration the thresholds are held as per-frame sums of squares,
+        so frames are compared on ``energy`` directly — no sqrt per frame.
+        """
         if not self._noise_calibrated:
-            self._noise_samples.append(rms)
-            if len(self._noise_samples) >= self._NOISE_CALIBRATION_FRAMES:
-                self._noise_floor = float(np.median(self._noise_samples))
+            self._noise_samples[self._noise_n] = np.sqrt(energy / len(audio_f32))
+            self._noise_n += 1
+            if self._noise_n >= _NOISE_CALIBRATION_FRAMES:
+                # Median of the even-sized window = mean of the middle two, via an
+                # in-place partial sort (the slots are refilled next utterance)
+                k = _NOISE_CALIBRATION_FRAMES // 2
+                ns = self._noise_samples
+                ns.partition((k - 1, k))
+                self._noise_floor = float(ns[k - 1] + ns[k]) * 0.5
                 self._noise_calibrated = True
-                threshold = max(self._noise_floor * self._SILENCE_FACTOR, self._MIN_SILENCE_THRESHOLD)
+                threshold = max(self._noise_floor * _SILENCE_FACTOR, _MIN_SILENCE_THRESHOLD)
+                speech_threshold = max(self._noise_floor * _SPEECH_THRESHOLD_FACTOR,
+                                       _MIN_SILENCE_THRESHOLD * 2)
+                self._rms_threshold = threshold * threshold * BLOCK_SIZE
+                self._rms_speech_threshold = speech_threshold * speech_threshold * BLOCK_SIZE
                 logger.info("Noise floor calibrated: %.4f (threshold: %.4f)", self._noise_floor, threshold)
             return
 
-        threshold = max(self._noise_floor * self._SILENCE_FACTOR, self._MIN_SILENCE_THRESHOLD)
-        speech_threshold = max(self._noise_floor * self._SPEECH_THRESHOLD_FACTOR, self._MIN_SILENCE_THRESHOLD * 2)
+        if energy > self._peak_energy:
+            self._peak_energy = energy
 
-        if rms > self._peak_rms:
-            self._peak_rms = rms
-
-        if rms >= speech_threshold:
+        if energy >= self._rms_speech_threshold:
             self._speech_frames += 1
-            if self._speech_frames >= self._MIN_SPEECH_FRAMES and not self._rms_speech_detected:
+            if self._speech_frames >= _MIN_SPEECH_FRAMES and not self._rms_speech_detected:
                 self._rms_speech_detected = True
                 logger.info("RMS: speech detected (rms=%.4f, threshold=%.4f, peak=%.4f)",
-                            rms, speech_threshold, self._peak_rms)
+                            np.sqrt(energy / BLOCK_SIZE), np.sqrt(self._rms_speech_threshold / BLOCK_SIZE),
+                            np.sqrt(self._peak_energy / BLOCK_SIZE))
 
         if self._rms_speech_detected:
-            if rms < threshold:
+            if energy < self._rms_threshold:
                 self._silence_frames += 1
             else:
                 self._silence_frames = 0
@@ -281,7 +593,7 @@ class STTEngine:
             return True
         # No-speech timeout — if nothing detected after N seconds, end
         if not self._speech_detected and self._listen_start_time > 0:
-            elapsed = time.time() - self._listen_start_time
+            elapsed = time.monotonic() - self._listen_start_time
             if elapsed > self._NO_SPEECH_TIMEOUT:
                 logger.info("No speech timeout (%.1fs) — ending utterance.", elapsed)
                 return True
@@ -311,110 +623,143 @@ class STTEngine:
                     return
                 yield STTResult("", is_final=False)
 
-    def _transcribe_loop(self, loop: asyncio.AbstractEventLoop):
+    @staticmethod
+    def _wait_for_audio(utt: _Utterance) -> int | None:
+        """Block until feed_audio publishes more samples; return the buffered count, or None once stopped."""
+        while not utt.ready.wait(timeout=0.5):
+            if utt.stopped.is_set():
+                return None
+        utt.ready.clear()
+        if utt.stopped.is_set():
+            return None
+        return utt.length
+
+    def _emit(self, loop: asyncio.AbstractEventLoop, result: STTResult):
+        """Hand a result from a worker thread to the results() consumer."""
+        loop.call_soon_threadsafe(self._result_queue.put_nowait, result)
+
+    def _transcribe_loop(self, loop: asyncio.AbstractEventLoop, utt: _Utterance):
         """Background thread: accumulate audio and transcribe."""
         try:
-            self._transcribe_whisper(loop)
+            self._transcribe_whisper(loop, utt)
         except ImportError:
             logger.warning("faster-whisper not available, trying Vosk STT")
             try:
-                self._transcribe_vosk(loop)
+                self._transcribe_vosk(loop, utt)
             except ImportError:
                 logger.error("No STT backend available!")
-                asyncio.run_coroutine_threadsafe(
-                    self._result_queue.put(STTResult("(STT unavailable)", is_final=True)),
-                    loop,
-                )
-
-    def _transcribe_whisper(self, loop: asyncio.AbstractEventLoop):
+                self._emit(loop, STTResult("(STT unavailable)", is_final=True))
+
+    def _whisper_model(self):
+        """Return the faster-whisper model, loading it (and the batched pipeline) once."""
+        with self._model_lock:
+            if self._model is None:
+                model = _load_whisper_model()
+                self._batched = _load_batched_pipeline(model)
+                self._model = model
+                self._backend = "faster-whisper"
+            return self._model
+
+    def _transcribe_whisper(self, loop: asyncio.AbstractEventLoop, utt: _Utterance):
         """Use faster-whisper (medium) with Greek-optimized settings."""
-        from faster_whisper import WhisperModel
-        import pathlib
-
-        if self._model is not None:
-            model = self._model
-            logger.info("Using pre-loaded faster-whisper '%s'.", _MODEL_SIZE)
-        else:
-            self._backend = "faster-whisper"
-            local_model = pathlib.Path(__file__).parent.parent / "models" / f"whisper-{_MODEL_SIZE}"
-            if local_model.exists():
-                model = WhisperModel(str(local_model), device="cpu", compute_type="int8")
-            else:
-                model = WhisperModel(_MODEL_SIZE, device="cpu", compute_type="int8")
-            self._model = model
-
-        # Collect audio
-        chunks: list[np.ndarray] = []
+        model = self._whisper_model()
+
+        # Audio lives in the utterance buffer; _wait_for_audio tells us how
+        # much of it is ready (feed_audio writes before it publishes).
+        pcm = utt.pcm
+        total_samples = 0
+        # Partials only decode audio that arrived since the previous partial
+        # and append to the running text, so each one costs O(new audio).
+        partial_samples = 0
         partial_sent = ""
-        last_partial_time = time.time()
+        partial_job: Future | None = None  # in-flight partial decode, at most one
+        # Same greedy settings for every partial of this utterance; no timestamp
+        # tokens — partials only need the text.
+        partial_opts = dict(language=self._language, beam_size=1, best_of=1, without_timestamps=True)
+        last_partial_time = time.monotonic()
 
         while True:
-            try:
-                frame = self._audio_queue.get(timeout=0.5)
-                if frame is None:
-                    break
-                if not self._active:
-                    break
-                chunks.append(frame)
-
-                # Partial transcription every ~1.5s for responsive feedback
-                total_samples = sum(len(c) for c in chunks)
-                elapsed = time.time() - last_partial_time
-                if self._speech_detected and total_samples >= SAMPLE_RATE * 1.5 and elapsed > 1.5:
-                    audio_np = np.concatenate(chunks).astype(np.float32) / 32768.0
-                    # Auto-gain for partials too
-                    p = float(np.max(np.abs(audio_np)))
-                    if p > 0.001:
-                        g = min(0.8 / p, 50.0)
-                        if g > 1.5:
-                            audio_np = np.clip(audio_np * g, -1.0, 1.0)
-                    segments, _ = model.transcribe(
-                        audio_np,
-                        language=self._language,
-                        beam_size=1,
-                        best_of=1,
-                        vad_filter=False,
-                        condition_on_previous_text=False,
-                    )
-                    text = " ".join(seg.text.strip() for seg in segments)
-                    last_partial_time = time.time()
-                    if text and text != partial_sent:
-                        partial_sent = text
-                        logger.info("STT partial: %s", text)
-                        asyncio.run_coroutine_threadsafe(
-                            self._result_queue.put(STTResult(text, is_final=False)),
-                            loop,
-                        )
-            except queue.Empty:
-                if not self._active:
-                    break
-                continue
+            ready = self._wait_for_audio(utt)
+            if ready is None or not self._active:
+                break
+            total_samples = ready
+
+            if partial_job is not None and partial_job.done():
+                try:
+                    new_text = partial_job.result()
+                except Exception as e:
+                    logger.warning("STT partial failed: %s", e)
+                    new_text = ""
+                partial_job = None
+                text = f"{partial_sent} {new_text}".strip() if new_text else partial_sent
+                if text and text != partial_sent:
+                    partial_sent = text
+                    logger.info("STT partial: %s", text)
+                    self._emit(loop, STTResult(text, is_final=False))
+
+            # Partial transcription every ~1.5s for responsive feedback
+            elapsed = time.monotonic() - last_partial_time
+            new_samples = total_samples - partial_samples
+            if (partial_job is None and self._speech_detected and new_samples >= SAMPLE_RATE
+                    and total_samples >= SAMPLE_RATE * 1.5 and elapsed > 1.5):
+                # Nothing to decode if the detectors heard only silence since the last partial
+                silent_ms = self._vad_silence_ms if self._vad_model is not None else self._silence_frames * _CHUNK_MS
+                if silent_ms * SAMPLE_RATE >= new_samples * 1000:
+                    partial_samples = total_samples
+                else:
+                    audio_np = pcm[partial_samples:total_samples]
+                    partial_samples = total_samples
+                    partial_job = self._partial_pool.submit(self._transcribe_partial, model, audio_np, partial_opts)
+                last_partial_time = time.monotonic()
+
+        # A partial still decoding is superseded by the final below
+        if partial_job is not None:
+            partial_job.cancel()
 
         # ── Final transcription with fast settings ─────────────────
-        if chunks:
-            audio_duration = sum(len(c) for c in chunks) / SAMPLE_RATE
-            audio_np = np.concatenate(chunks).astype(np.float32) / 32768.0
+        if total_samples:
+            audio_np = pcm[:total_samples]
+            audio_duration = len(audio_np) / SAMPLE_RATE
 
             # ── Normalize audio amplitude ─────────────────────────────
-            peak = float(np.max(np.abs(audio_np)))
+            # In place: nothing reads this utterance's buffer after the final
+            # (a partial still in flight is discarded anyway).
+            peak = max(float(audio_np.max()), -float(audio_np.min()))
             if peak > 0.001:
                 gain = min(0.8 / peak, 50.0)
                 if gain > 1.5:
                     logger.info("Audio auto-gain: %.1fx (peak was %.4f)", gain, peak)
-                    audio_np = np.clip(audio_np * gain, -1.0, 1.0)
+                    np.multiply(audio_np, np.float32(gain), out=audio_np)
+                    np.clip(audio_np, -1.0, 1.0, out=audio_np)
 
-            t_start = time.time()
+            t_start = time.monotonic()
             logger.info("Transcribing final audio (%.1fs) with beam_size=1…", audio_duration)
 
-            segments_iter, info = model.transcribe(
-                audio_np,
-                language=self._language,
-                beam_size=1,
-                best_of=1,
-                vad_filter=False,
-                condition_on_previous_text=False,
-                no_speech_threshold=0.6,
-            )
+            if self._batched is not None:
+                # Long utterances are split at pauses and the clips decoded as one
+                # batch. No pipeline VAD: the capture VAD already accepted this
+                # audio as speech, and a second pass could drop some of it.
+                # Timestamps stay on so each segment gets its own no_speech_prob.
+                segments_iter, info = self._batched.transcribe(
+                    audio_np,
+                    language=self._language,
+                    beam_size=1,
+                    best_of=1,
+                    batch_size=_FINAL_BATCH_SIZE,
+                    vad_filter=False,
+                    clip_timestamps=_clips_at_pauses(audio_np, _FINAL_CHUNK_S),
+                    no_speech_threshold=0.6,
+                )
+            else:
+                segments_iter, info = model.transcribe(
+                    audio_np,
+                    language=self._language,
+                    beam_size=1,
+                    best_of=1,
+                    vad_filter=False,
+                    condition_on_previous_text=False,
+                    no_speech_threshold=0.6,
+                )
 
             good_segments = []
             for seg in segments_iter:
@@ -429,79 +774,109 @@ class STTEngine:
             # Detect repeated hallucination pattern
             if final_text:
                 words = final_text.split()
-                if len(words) >= 6:
-                    half = len(words) // 2
-                    first_half = " ".join(words[:half])
-                    second_half = " ".join(words[half:2*half])
-                    if first_half == second_half:
-                        logger.info("Filtered repetitive hallucination: '%s'", final_text[:80])
-                        final_text = ""
-
-            t_elapsed = time.time() - t_start
+                cut = _repeated_tail_start(words)
+                if cut is not None:
+                    logger.info("Filtered repetitive hallucination: '%s'", " ".join(words[cut:])[:80])
+                    final_text = " ".join(words[:cut])
+
+            t_elapsed = time.monotonic() - t_start
             logger.info("STT final: '%s' (took %.1fs)", final_text or "(empty)", t_elapsed)
-            asyncio.run_coroutine_threadsafe(
-                self._result_queue.put(STTResult(final_text or "(no speech detected)", is_final=True)),
-                loop,
+            self._emit(loop, STTResult(final_text or "(no speech detected)", is_final=True))
+        else:
+            self._emit(loop, STTResult("", is_final=True))
+
+    def _transcribe_partial(self, model, audio_np: np.ndarray, opts: dict) -> str:
+        """Fast greedy decode of a partial window (batched clips when available)."""
+        # Auto-gain for partials too, into the worker's scratch (the buffer stays unscaled)
+        p = float(np.max(np.abs(audio_np)))
+        if p > 0.001:
+            g = min(0.8 / p, 50.0)
+            if g > 1.5:
+                scaled = self._partial_gain_f32[:len(audio_np)]
+                np.multiply(audio_np, np.float32(g), out=scaled)
+                audio_np = np.clip(scaled, -1.0, 1.0, out=scaled)
+        if self._batched is not None:
+            segments, _ = self._batched.transcribe(
+                audio_np, clip_timestamps=_clips_at_pauses(audio_np, _PARTIAL_CHUNK_S),
+                batch_size=_PARTIAL_BATCH_SIZE, **opts,
             )
         else:
-            asyncio.run_coroutine_threadsafe(
-                self._result_queue.put(STTResult("", is_final=True)),
-                loop,
+            segments, _ = model.transcribe(
+                audio_np, vad_filter=False, condition_on_previous_text=False, **opts,
             )
+        return " ".join(seg.text.strip() for seg in segments)
 
-    def _transcribe_vosk(self, loop: asyncio.AbstractEventLoop):
+    def _transcribe_vosk(self, loop: asyncio.AbstractEventLoop, utt: _Utterance):
         """Fallback: use Vosk for streaming STT."""
         from vosk import Model, KaldiRecognizer, SetLogLevel
 
         SetLogLevel(-1)
         self._backend = "vosk"
 
-        model_path = os.getenv("VOSK_MODEL_PATH", "")
-        if not model_path:
-            models_dir = __import__("pathlib").Path(__file__).resolve().parent.parent / "models"
-            for d in models_dir.iterdir():
-                if d.is_dir() and "whisper" not in d.name.lower():
-                    model_path = str(d)
-                    break
+        with self._model_lock:
+            if self._vosk_model is None:
+                model_path = os.getenv("VOSK_MODEL_PATH", "")
+                if not model_path:
+                    models_dir = Path(__file__).resolve().parent.parent / "models"
+                    for d in models_dir.iterdir():
+                        if d.is_dir() and "whisper" not in d.name.lower():
+                            model_path = str(d)
+                            break
+
+                if not model_path:
+                    raise ImportError("No Vosk model found")
 
-        if not model_path:
-            raise ImportError("No Vosk model found")
+                logger.info("Loading Vosk STT model from %s", model_path)
+                self._vosk_model = Model(model_path)
+            model = self._vosk_model
 
-        model = Model(model_path)
         rec = KaldiRecognizer(model, SAMPLE_RATE)
         rec.SetWords(False)
 
+        pcm = utt.pcm
+        pcm16 = np.empty(len(pcm), dtype=np.int16)  # Kaldi wants int16 PCM
+        # vosk is an ABI-mode cffi binding: AcceptWaveform hands `data` straight
+        # to a `const char *` and uses len(data) as the byte count, so a cffi
+        # char[] over our int16 buffer works without a bytes copy.
+        try:
+            from vosk import _ffi as vosk_ffi
+            as_waveform = vosk_ffi.from_buffer
+        except ImportError:
+            as_waveform = np.ndarray.tobytes
+        fed = 0
+        accept, result_json, partial_json = rec.AcceptWaveform, rec.Result, rec.PartialResult
         while True:
-            try:
-                frame = self._audio_queue.get(timeout=0.5)
-                if frame is None:
-                    break
-                data = frame.tobytes()
-
-                if rec.AcceptWaveform(data):
-                    result = json.loads(rec.Result())
-                    text = result.get("text", "")
-                    if text:
-                        asyncio.run_coroutine_threadsafe(
-                            self._result_queue.put(STTResult(text, is_final=False)),
-                            loop,
-                        )
-                else:
-                    partial = json.loads(rec.PartialResult())
-                    text = partial.get("partial", "")
-                    if text:
-                        asyncio.run_coroutine_threadsafe(
-                            self._result_queue.put(STTResult(text, is_final=False)),
-                            loop,
-                        )
-            except queue.Empty:
-                if not self._active:
-                    break
+            ready = self._wait_for_audio(utt)
+            if ready is None:
+                break
+            # ~300 ms per AcceptWaveform: fewer FFI calls and result parses, and
+            # Vosk partials don't move faster than that anyway
+            if ready - fed < _VOSK_FEED_SAMPLES:
                 continue
-
-        result = json.loads(rec.FinalResult())
+            # Back to int16 PCM for Kaldi — exact, the buffer holds int16 / 32768
+            chunk = pcm16[fed:ready]
+            np.multiply(pcm[fed:ready], np.float32(32768.0), out=chunk, casting="unsafe")
+            data = as_waveform(chunk)
+            fed = ready
+
+            if accept(data):
+                result = orjson.loads(result_json())
+                text = result.get("text", "")
+                if text:
+                    self._emit(loop, STTResult(text, is_final=False))
+            else:
+                partial = orjson.loads(partial_json())
+                text = partial.get("partial", "")
+                if text:
+                    self._emit(loop, STTResult(text, is_final=False))
+
+        # The tail still short of a full chunk goes in before the final result
+        tail = utt.length
+        if tail > fed:
+            chunk = pcm16[fed:tail]
+            np.multiply(pcm[fed:tail], np.float32(32768.0), out=chunk, casting="unsafe")
+            accept(as_waveform(chunk))
+
+        result = orjson.loads(rec.FinalResult())
         final_text = result.get("text", "")
-        asyncio.run_coroutine_threadsafe(
-            self._result_queue.put(STTResult(final_text or "(no speech)", is_final=True)),
-            loop,
-        )
+        self._emit(loop, STTResult(final_text or "(no speech)", is_final=True))
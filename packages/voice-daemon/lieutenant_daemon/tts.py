@@ -5,6 +5,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import re
+import shutil
 import subprocess
 import tempfile
 import threading
@@ -27,6 +29,11 @@ _EDGE_VOICES = {
     "en-male": "en-US-GuyNeural",     # Male English
 }
 _VOICE_GENDER = os.getenv("TTS_VOICE_GENDER", "female")  # "female" or "male"
+_FFPLAY = shutil.which("ffplay")  # lets edge-tts audio be piped straight into playback
+_SENTENCE_END = re.compile(r'(?<=[.!;·…\n])\s*')  # split point after sentence punctuation
+# One `say -v ?` line: "<voice name>   <locale>   # <sample text>"; only the
+# name's first token is kept — what `say -v` was always passed.
+_SAY_VOICE_LINE = re.compile(r"^(\S+)[^\n#]*?\s([a-z]{2,3}_[A-Za-z0-9]+)\s+#", re.MULTILINE)
 
 # Log at import time so we know if .env was loaded
 logger.info("TTS config: backend=%s, gender=%s", _TTS_BACKEND, _VOICE_GENDER)
@@ -39,11 +46,20 @@ class TTSEngine:
     Fallback: macOS 'say', espeak, Azure.
     """
 
+    # Level-animation jitter, cycled instead of drawing from the global RNG per tick
+    _JITTER: list[float] = np.random.default_rng().random(256).tolist()
+
     def __init__(self, on_rms: Callable[[float], None] | None = None):
         self._on_rms = on_rms
+        self._jitter_i = 0
         self._playing = False
         self._cancelled = False
-        self._process: subprocess.Popen | None = None
+        self._process: asyncio.subprocess.Process | None = None
+        # `say -v ?` is listed once; the voice picked per language is reused
+        self._say_voices: dict[str, str] | None = None  # voice name → locale
+        self._say_voice_flags: dict[str, list[str]] = {}
+        self._edge_voice = _EDGE_VOICES["el"]
+        self._azure_synths: dict[str, list] = {}  # idle Azure synthesizers by language
 
         # Resolve backend name immediately for logging
         if _TTS_BACKEND == "edge":
@@ -65,6 +81,10 @@ class TTSEngine:
         else:
             self._backend = _TTS_BACKEND
 
+    def _jitter(self) -> float:
+        self._jitter_i = (self._jitter_i + 1) & 255
+        return self._JITTER[self._jitter_i]
+
     @property
     def is_playing(self) -> bool:
         return self._playing
@@ -88,45 +108,56 @@ class TTSEngine:
         self._cancelled = False
         self._playing = True
         self._language = language
+        self._edge_voice = self._resolve_edge_voice(language)  # once per response, not per sentence
 
-        sentences = self._split_sentences(text)
+        sentences = [s.strip() for s in self._split_sentences(text) if s.strip()]
         if not sentences:
             self._playing = False
             return True
 
-        for sentence in sentences:
-            if self._cancelled:
-                self._playing = False
-                return False
+        # One sentence ahead: synthesize N+1 while N plays. The first sentence
+        # has nothing ahead of it and is spoken (or streamed) directly.
+        pending: asyncio.Task | None = None
+        try:
+            for i, sentence in enumerate(sentences):
+                if self._cancelled:
+                    self._playing = False
+                    return False
 
-            sentence = sentence.strip()
-            if not sentence:
-                continue
+                synth, pending = pending, None
+                if i + 1 < len(sentences):
+                    pending = self._start_synth(sentences[i + 1])
 
-            logger.info("TTS speaking: %s", sentence[:60])
-            success = await self._speak_one(sentence)
-            if not success or self._cancelled:
-                self._playing = False
-                return False
+                logger.info("TTS speaking: %s", sentence[:60])
+                success = await self._speak_one(sentence, synth)
+                if not success or self._cancelled:
+                    self._playing = False
+                    return False
+        finally:
+            if pending is not None:
+                self._discard_synth(pending)
 
         self._playing = False
         return True
 
-    async def _speak_one(self, text: str) -> bool:
-        """Speak a single sentence using the best available backend."""
+    async def _speak_one(self, text: str, synth: asyncio.Task | None = None) -> bool:
+        """Speak a single sentence using the best available backend.
+
+        ``synth`` is a synthesis of ``text`` already in flight (see _start_synth).
+        """
         try:
             if _TTS_BACKEND == "edge":
-                result = await self._speak_edge(text)
+                result = await self._speak_edge(text, synth)
                 if result:
                     return True
                 # Fallback chain
                 return await self._speak_say(text)
             elif _TTS_BACKEND == "say":
-                return await self._speak_say(text)
+                return await self._speak_say(text, synth)
             elif _TTS_BACKEND == "azure":
-                return await self._speak_azure(text)
+                return await self._speak_azure(text, synth)
             elif _TTS_BACKEND == "local":
-                result = await self._speak_edge(text)
+                result = await self._speak_edge(text, synth)
                 if result:
                     return True
                 return await self._speak_say(text)
@@ -136,157 +167,177 @@ class TTSEngine:
             logger.error("TTS error: %s", e)
             return False
 
-    async def _speak_edge(self, text: str) -> bool:
+    def _start_synth(self, text: str) -> asyncio.Task | None:
+        """Start rendering ``text`` to a temp file ahead of playback, if the backend can."""
+        if _TTS_BACKEND in ("edge", "local"):
+            return asyncio.create_task(self._synth_edge(text))
+        if _TTS_BACKEND == "say":
+            return asyncio.create_task(self._synth_say(text))
+        if _TTS_BACKEND == "azure":
+            return asyncio.create_task(self._synth_azure(text))
+        return None
+
+    async def _speak_edge(self, text: str, synth: asyncio.Task | None = None) -> bool:
         """Use edge-tts — Microsoft Neural voices (free, excellent Greek)."""
-        try:
-            import edge_tts
-        except ImportError:
-            logger.warning("edge-tts not installed. pip install edge-tts")
+        if synth is None and _FFPLAY:
+            return await self._stream_edge(text)
+        temp_path = await (synth if synth is not None else self._synth_edge(text))
+        if temp_path is None:
             return False
-
         self._backend = "edge-tts"
-        lang = getattr(self, '_language', 'el')
 
-        # Pick voice based on language + gender preference
-        voice_key = f"{lang}-male" if _VOICE_GENDER == "male" else lang
-        voice = _EDGE_VOICES.get(voice_key, _EDGE_VOICES.get(lang, "el-GR-AthinaNeural"))
-        logger.info("edge-tts voice: %s (gender=%s, lang=%s, key=%s)", voice, _VOICE_GENDER, lang, voice_key)
+        if self._cancelled:
+            self._cleanup_temp(temp_path)
+            return False
 
+        # Play back with ffplay/afplay/mpv and compute real RMS
+        success = await self._play_audio_file(temp_path)
+        self._cleanup_temp(temp_path)
+        return success
+
+    async def _synth_edge(self, text: str) -> str | None:
+        """Synthesize one sentence with edge-tts into a temp mp3. None on failure."""
         try:
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-                temp_path = f.name
+            import edge_tts
+        except ImportError:
+            logger.warning("edge-tts not installed. pip install edge-tts")
+            return None
 
+        voice = self._edge_voice
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
+            temp_path = f.name
+        try:
             communicate = edge_tts.Communicate(text, voice)
             await communicate.save(temp_path)
-
-            if self._cancelled:
-                self._cleanup_temp(temp_path)
-                return False
-
-            # Play back with ffplay/afplay/mpv and compute real RMS
-            success = await self._play_audio_file(temp_path)
+            return temp_path
+        except asyncio.CancelledError:
             self._cleanup_temp(temp_path)
-            return success
-
+            raise
         except Exception as e:
+            self._cleanup_temp(temp_path)
             logger.error("edge-tts error: %s", e)
-            return False
-
-    async def _play_audio_file(self, path: str) -> bool:
-        """Play an audio file and report RMS levels. Tries afplay (macOS), then ffplay."""
-        import struct
+            return None
 
-        # Try to decode to raw PCM for real RMS, then play
+    async def _stream_edge(self, text: str) -> bool:
+        """Pipe edge-tts audio into ffplay as it arrives — playback starts on the first chunk."""
         try:
-            # Use ffmpeg to decode to raw PCM while playing via afplay/ffplay
-            # First, start playback
-            if os.path.exists("/usr/bin/afplay"):
-                self._process = subprocess.Popen(
-                    ["afplay", path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                )
-            else:
-                # Try ffplay (silent, no window)
-                self._process = subprocess.Popen(
-                    ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                )
+            import edge_tts
+        except ImportError:
+            logger.warning("edge-tts not installed. pip install edge-tts")
+            return False
 
-            # While playing, report simulated RMS (real RMS would need audio capture)
-            while self._process.poll() is None:
+        voice = self._edge_voice
+        proc = await asyncio.create_subprocess_exec(
+            _FFPLAY, "-nodisp", "-autoexit", "-loglevel", "quiet", "-i", "pipe:0",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        self._process = proc
+        self._backend = "edge-tts"
+        try:
+            async for chunk in edge_tts.Communicate(text, voice).stream():
                 if self._cancelled:
-                    self._process.kill()
+                    proc.kill()
                     return False
-                if self._on_rms:
-                    # Slightly randomized RMS to drive waveform animation
-                    self._on_rms(0.18 + 0.12 * np.random.random())
-                await asyncio.sleep(0.05)
+                if chunk["type"] == "audio":
+                    proc.stdin.write(chunk["data"])
+                    await proc.stdin.drain()
+                    if self._on_rms:
+                        self._on_rms(0.18 + 0.12 * self._jitter())
+            proc.stdin.close()
+        except Exception as e:
+            if proc.returncode is None:
+                proc.kill()
+            logger.error("edge-tts stream error: %s", e)
+            return False
+        return await self._wait_player(proc, 0.18, 0.12)
 
-            if self._on_rms:
-                self._on_rms(0.0)
+    @staticmethod
+    def _resolve_edge_voice(lang: str) -> str:
+        """Pick the edge-tts voice from the language + gender preference."""
+        voice_key = f"{lang}-male" if _VOICE_GENDER == "male" else lang
+        voice = _EDGE_VOICES.get(voice_key, _EDGE_VOICES.get(lang, "el-GR-AthinaNeural"))
+        logger.info("edge-tts voice: %s (gender=%s, lang=%s, key=%s)", voice, _VOICE_GENDER, lang, voice_key)
+        return voice
 
-            return self._process.returncode == 0
+    def _discard_synth(self, task: asyncio.Task):
+        """Drop a prefetched synthesis that will not be played."""
+        if not task.done():
+            task.cancel()  # _synth_edge removes its own temp file
+        elif not task.cancelled() and task.result():
+            self._cleanup_temp(task.result())
 
+    async def _play_audio_file(self, path: str) -> bool:
+        """Play an audio file and report RMS levels. Tries afplay (macOS), then ffplay."""
+        try:
+            if os.path.exists("/usr/bin/afplay"):
+                cmd = ["afplay", path]
+            else:
+                # Try ffplay (silent, no window)
+                cmd = ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", path]
+            return await self._run_player(cmd, 0.18, 0.12)
         except FileNotFoundError:
             logger.warning("No audio player found (afplay/ffplay). Trying mpv…")
             try:
-                self._process = subprocess.Popen(
-                    ["mpv", "--no-video", "--really-quiet", path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                )
-                while self._process.poll() is None:
-                    if self._cancelled:
-                        self._process.kill()
-                        return False
-                    if self._on_rms:
-                        self._on_rms(0.15 + 0.1 * np.random.random())
-                    await asyncio.sleep(0.05)
-                if self._on_rms:
-                    self._on_rms(0.0)
-                return self._process.returncode == 0
+                return await self._run_player(["mpv", "--no-video", "--really-quiet", path], 0.15, 0.1)
             except FileNotFoundError:
                 logger.error("No audio player available (afplay, ffplay, mpv).")
                 return False
 
-    async def _speak_say(self, text: str) -> bool:
-        """Use macOS 'say' command (fallback)."""
-        self._backend = "say"
-
-        lang = getattr(self, '_language', 'el')
-        voice_flag = []
+    async def _run_player(self, cmd: list[str], level: float, spread: float, stdin: bytes | None = None) -> bool:
+        """Start a playback/speech command and wait it out (see _wait_player)."""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE if stdin is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        self._process = proc
+        if stdin is not None:
+            proc.stdin.write(stdin)
+            proc.stdin.close()
+        return await self._wait_player(proc, level, spread)
+
+    async def _wait_player(self, proc: asyncio.subprocess.Process, level: float, spread: float) -> bool:
+        """Animate the speaker level until ``proc`` exits. False if cancelled or it failed."""
+        # The exit arrives via the child watcher; the 50 ms timeout only paces
+        # the level animation and the cancel check.
+        done = asyncio.ensure_future(proc.wait())
         try:
-            result = subprocess.run(
-                ["say", "-v", "?"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if lang == "el":
-                for line in result.stdout.splitlines():
-                    if "el_GR" in line or "Melina" in line:
-                        voice_name = line.split()[0]
-                        voice_flag = ["-v", voice_name]
-                        break
-            elif lang == "en":
-                for preferred in ("Samantha", "Alex", "Daniel"):
-                    for line in result.stdout.splitlines():
-                        if line.startswith(preferred) and "en_" in line:
-                            voice_flag = ["-v", preferred]
-                            break
-                    if voice_flag:
-                        break
-        except Exception:
-            pass
-
-        try:
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-                f.write(text)
-                temp_path = f.name
-
-            cmd = ["say"] + voice_flag + ["-f", temp_path]
-            self._process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-
-            while self._process.poll() is None:
+            while not done.done():
                 if self._cancelled:
-                    self._process.kill()
+                    proc.kill()
                     return False
                 if self._on_rms:
-                    self._on_rms(0.15 + 0.1 * np.random.random())
-                await asyncio.sleep(0.05)
+                    # Slightly randomized RMS to drive waveform animation
+                    self._on_rms(level + spread * self._jitter())
+                await asyncio.wait((done,), timeout=0.05)
+        finally:
+            done.cancel()
 
-            self._cleanup_temp(temp_path)
-            if self._on_rms:
-                self._on_rms(0.0)
+        if self._on_rms:
+            self._on_rms(0.0)
+        return proc.returncode == 0
 
-            return self._process.returncode == 0
+    async def _speak_say(self, text: str, synth: asyncio.Task | None = None) -> bool:
+        """Use macOS 'say' command (fallback)."""
+        self._backend = "say"
 
+        temp_path = await synth if synth is not None else None
+        if temp_path is not None:
+            try:
+                if self._cancelled:
+                    return False
+                return await self._play_audio_file(temp_path)
+            finally:
+                self._cleanup_temp(temp_path)
+
+        voice_flag = self._say_voice_flag(getattr(self, '_language', 'el'))
+
+        try:
+            # Text goes in over stdin (`-f -`) — no temp file per sentence
+            return await self._run_player(["say", *voice_flag, "-f", "-"], 0.15, 0.1, stdin=text.encode())
         except FileNotFoundError:
             logger.warning("'say' command not found (not macOS?)")
             return await self._speak_espeak(text)
@@ -294,33 +345,73 @@ class TTSEngine:
             logger.error("say error: %s", e)
             return False
 
+    async def _synth_say(self, text: str) -> str | None:
+        """Render one sentence with `say -o` into a temp AIFF. None on failure."""
+        voice_flag = self._say_voice_flag(getattr(self, '_language', 'el'))
+        with tempfile.NamedTemporaryFile(suffix=".aiff", delete=False) as f:
+            temp_path = f.name
+        proc = None
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "say", *voice_flag, "-o", temp_path, "-f", "-",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            await proc.communicate(text.encode())
+            if proc.returncode == 0:
+                return temp_path
+        except asyncio.CancelledError:
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+            self._cleanup_temp(temp_path)
+            raise
+        except Exception as e:
+            logger.debug("say -o failed: %s", e)
+        self._cleanup_temp(temp_path)
+        return None
+
+    def _say_voice_flag(self, lang: str) -> list[str]:
+        """Return the `say -v <voice>` flag for a language ([] = system default)."""
+        if lang in self._say_voice_flags:
+            return self._say_voice_flags[lang]
+        if self._say_voices is None:
+            try:
+                result = subprocess.run(
+                    ["say", "-v", "?"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5,
+                )
+                self._say_voices = dict(_SAY_VOICE_LINE.findall(result.stdout))
+            except Exception:
+                self._say_voices = {}
+
+        voice_flag: list[str] = []
+        if lang == "el":
+            name = next((n for n, loc in self._say_voices.items() if loc == "el_GR" or n == "Melina"), None)
+            if name:
+                voice_flag = ["-v", name]
+        elif lang == "en":
+            for preferred in ("Samantha", "Alex", "Daniel"):
+                if self._say_voices.get(preferred, "").startswith("en_"):
+                    voice_flag = ["-v", preferred]
+                    break
+        self._say_voice_flags[lang] = voice_flag
+        return voice_flag
+
     async def _speak_espeak(self, text: str) -> bool:
         """Fallback: use espeak for Linux."""
         self._backend = "espeak"
         lang = getattr(self, '_language', 'el')
         try:
-            self._process = subprocess.Popen(
-                ["espeak", "-v", lang, text],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            while self._process.poll() is None:
-                if self._cancelled:
-                    self._process.kill()
-                    return False
-                if self._on_rms:
-                    self._on_rms(0.12 + 0.1 * np.random.random())
-                await asyncio.sleep(0.05)
-
-            if self._on_rms:
-                self._on_rms(0.0)
-            return self._process.returncode == 0
+            return await self._run_player(["espeak", "-v", lang, text], 0.12, 0.1)
         except FileNotFoundError:
             logger.warning("espeak not found either. No TTS available.")
             self._backend = "none"
             return False
 
-    async def _speak_azure(self, text: str) -> bool:
+    async def _speak_azure(self, text: str, synth: asyncio.Task | None = None) -> bool:
         """Use Azure Speech Services TTS."""
         key = os.getenv("AZURE_SPEECH_KEY", "")
         region = os.getenv("AZURE_SPEECH_REGION", "")
@@ -328,6 +419,16 @@ class TTSEngine:
             logger.warning("Azure Speech not configured. Falling back.")
             return await self._speak_edge(text) or await self._speak_say(text)
 
+        temp_path = await synth if synth is not None else None
+        if temp_path is not None:
+            self._backend = "azure"
+            try:
+                if self._cancelled:
+                    return False
+                return await self._play_audio_file(temp_path)
+            finally:
+                self._cleanup_temp(temp_path)
+
         try:
             import azure.cognitiveservices.speech as speechsdk
 
@@ -337,7 +438,8 @@ class TTSEngine:
             config.speech_synthesis_voice_name = "el-GR-AthinaNeural" if lang == 'el' else "en-US-JennyNeural"
             synthesizer = speechsdk.SpeechSynthesizer(speech_config=config)
 
-            result = synthesizer.speak_text_async(text).get()
+            # The SDK call blocks until playback ends — keep it off the event loop
+            result = await asyncio.to_thread(lambda: synthesizer.speak_text_async(text).get())
             if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
                 return True
             else:
@@ -347,6 +449,41 @@ class TTSEngine:
             logger.warning("Azure Speech SDK not installed.")
             return await self._speak_edge(text) or await self._speak_say(text)
 
+    async def _synth_azure(self, text: str) -> str | None:
+        """Render one sentence with Azure into a temp WAV (no playback). None on failure."""
+        key = os.getenv("AZURE_SPEECH_KEY", "")
+        region = os.getenv("AZURE_SPEECH_REGION", "")
+        if not key or not region:
+            return None
+        try:
+            import azure.cognitiveservices.speech as speechsdk
+        except ImportError:
+            return None
+
+        # Synthesizers (and their service connections) are reused across sentences
+        lang = getattr(self, '_language', 'el')
+        idle = self._azure_synths.setdefault(lang, [])
+        if idle:
+            synthesizer = idle.pop()
+        else:
+            config = speechsdk.SpeechConfig(subscription=key, region=region)
+            config.speech_synthesis_voice_name = "el-GR-AthinaNeural" if lang == 'el' else "en-US-JennyNeural"
+            synthesizer = speechsdk.SpeechSynthesizer(speech_config=config, audio_config=None)
+        try:
+            result = await asyncio.to_thread(lambda: synthesizer.speak_text_async(text).get())
+        except Exception as e:
+            logger.error("Azure TTS error: %s", e)
+            return None
+        finally:
+            idle.append(synthesizer)
+
+        if result.reason != speechsdk.ResultReason.SynthesizingAudioCompleted:
+            logger.error("Azure TTS failed: %s", result.reason)
+            return None
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            f.write(result.audio_data)
+            return f.name
+
     @staticmethod
     def _cleanup_temp(path: str):
         try:
@@ -357,15 +494,17 @@ class TTSEngine:
     @staticmethod
     def _split_sentences(text: str) -> list[str]:
         """Split text into sentences for chunked TTS."""
-        import re
-        sentences = re.split(r'(?<=[.!;·…\n])\s*', text)
         merged = []
-        buf = ""
-        for s in sentences:
-            buf += s + " "
-            if len(buf) > 30:
-                merged.append(buf.strip())
-                buf = ""
-        if buf.strip():
-            merged.append(buf.strip())
+        buf: list[str] = []
+        size = 0
+        for s in _SENTENCE_END.split(text):
+            buf.append(s)
+            size += len(s) + 1
+            if size > 30:
+                merged.append(" ".join(buf).strip())
+                buf.clear()
+                size = 0
+        tail = " ".join(buf).strip()
+        if tail:
+            merged.append(tail)
         return merged
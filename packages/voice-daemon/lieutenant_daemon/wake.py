@@ -6,18 +6,25 @@ import asyncio
 import json
 import logging
 import os
-import queue
+import re
 import threading
 import time
+from collections import deque
 from pathlib import Path
 from typing import Callable, Awaitable
 
 import numpy as np
+import orjson
+
+from lieutenant_daemon.audio_capture import BLOCK_SIZE
 
 logger = logging.getLogger("lieutenant-daemon")
 
 _WAKE_PHRASE = os.getenv("WAKE_PHRASE", "υπολοχαγέ").lower()
 _COOLDOWN = 1.2  # seconds between triggers — fast re-triggering
+_QUEUE_FRAMES = 200  # frames buffered for the recognizer; the oldest drop first
+_RING_FRAMES = 256   # frame slots; the margin over _QUEUE_FRAMES covers the span being decoded
+_FEED_FRAMES = 4     # frames per AcceptWaveform call (~256 ms)
 
 # ── Vosk model directories by language ────────────────────────────────
 _MODELS_DIR = Path(__file__).resolve().parent.parent / "models"
@@ -55,18 +62,30 @@ class WakeDetector:
         self._enabled = True
         self._last_trigger = 0.0
         self._recognizer = None
-        self._audio_queue: queue.Queue[bytes] = queue.Queue(maxsize=200)
+        # Frames are copied into fixed slots of a preallocated ring; the deque
+        # carries (slot, length) so no bytes object is made per frame. One
+        # producer (capture thread), one consumer (_process_loop).
+        self._ring = np.empty((_RING_FRAMES, BLOCK_SIZE), dtype=np.int16)
+        self._ring_slot = 0
+        self._audio_frames: deque[tuple[int, int]] = deque(maxlen=_QUEUE_FRAMES)
+        self._audio_ready = threading.Event()
         self._running = False
         self._thread: threading.Thread | None = None
         self._wake_phrase = _WAKE_PHRASE
+        self._wake_re = self._compile_wake(_WAKE_PHRASE)
         self._current_lang = os.getenv("LANGUAGE", "el")
         self._models: dict[str, object] = {}  # loaded Vosk Model objects by lang
+        self._recognizers: dict[tuple[str, str], object] = {}  # built recognizers by (lang, phrase)
         self._model_lock = threading.Lock()
         self._need_reload = False  # flag to reload recognizer in process loop
+        self._need_reset = False  # flag to Reset() the recognizer in process loop (re-enable)
 
     def set_wake_phrase(self, phrase: str, language: str | None = None):
         """Change the wake phrase and optionally switch Vosk model for the new language."""
-        self._wake_phrase = phrase.lower()
+        phrase = phrase.lower()
+        phrase_changed = phrase != self._wake_phrase
+        self._wake_phrase = phrase
+        self._wake_re = self._compile_wake(phrase)
         logger.info("Wake phrase changed to: '%s'", self._wake_phrase)
         if language and language != self._current_lang:
             self._current_lang = language
@@ -75,6 +94,8 @@ class WakeDetector:
                 self._need_reload = True
             else:
                 logger.warning("No Vosk model for language '%s' — wake detection may not work", language)
+        elif phrase_changed and self._recognizer is not None:
+            self._need_reload = True  # the grammar is built around the phrase
 
     @property
     def enabled(self) -> bool:
@@ -82,6 +103,11 @@ class WakeDetector:
 
     @enabled.setter
     def enabled(self, val: bool):
+        if val and not self._enabled:
+            # Frames left from before the disable (up to _FEED_FRAMES - 1) are
+            # stale: drop them, and start the recognizer fresh on new audio.
+            self._audio_frames.clear()
+            self._need_reset = True
         self._enabled = val
         if val:
             logger.info("Wake detection ENABLED")
@@ -103,10 +129,14 @@ class WakeDetector:
         """Feed int16 audio frames from the capture callback."""
         if not self._enabled:
             return
-        try:
-            self._audio_queue.put_nowait(audio.tobytes())
-        except queue.Full:
-            pass  # Drop frames if queue is full
+        n = len(audio)
+        if n > BLOCK_SIZE:
+            return
+        slot = self._ring_slot
+        self._ring[slot, :n] = audio
+        self._ring_slot = (slot + 1) % _RING_FRAMES
+        self._audio_frames.append((slot, n))  # full deque drops its oldest frame
+        self._audio_ready.set()
 
     # ── Phonetic variant map for robust matching ──────────────────────
     # Vosk small models may segment words differently; check alternatives too.
@@ -115,15 +145,19 @@ class WakeDetector:
                         "lew tenant", "loo tenant", "lef tenant"],
     }
 
+    @classmethod
+    def _compile_wake(cls, phrase: str) -> re.Pattern[str]:
+        """One alternation over the phrase and its phonetic variants."""
+        variants = cls._PHONETIC_VARIANTS.get(phrase, [])
+        return re.compile("|".join(map(re.escape, dict.fromkeys([phrase, *variants]))))
+
     def _matches_wake(self, text: str) -> bool:
-        """Check if text contains the wake phrase or a known phonetic variant."""
-        if not text:
-            return False
-        if self._wake_phrase in text:
-            return True
-        # Check phonetic variants
-        variants = self._PHONETIC_VARIANTS.get(self._wake_phrase, [])
-        return any(v in text for v in variants)
+        """Check if text contains the wake phrase or a known phonetic variant.
+
+        Vosk emits lowercase words (the grammar is the lowercased phrase),
+        so text is matched as-is.
+        """
+        return self._wake_re.search(text) is not None
 
     def _process_loop(self):
         """Background thread: initialize Vosk and process audio."""
@@ -140,6 +174,16 @@ class WakeDetector:
 
             logger.info("Wake detector ready. Listening for '%s' (lang=%s)", self._wake_phrase, self._current_lang)
 
+            # vosk's cffi AcceptWaveform takes any buffer as `const char *` —
+            # pass ring slots without a bytes copy when the binding allows it.
+            try:
+                from vosk import _ffi as vosk_ffi
+                as_waveform = vosk_ffi.from_buffer
+            except ImportError:
+                as_waveform = np.ndarray.tobytes
+            ring = self._ring
+            frames = self._audio_frames
+
             while self._running:
                 # Hot-reload model if language changed
                 if self._need_reload:
@@ -151,18 +195,32 @@ class WakeDetector:
                                     self._current_lang, self._wake_phrase)
                     else:
                         logger.warning("Could not load Vosk model for '%s', keeping previous.", self._current_lang)
-
-                try:
-                    data = self._audio_queue.get(timeout=0.5)
-                except queue.Empty:
+                if self._need_reset:
+                    self._need_reset = False
+                    self._recognizer.Reset()
+
+                if len(frames) < _FEED_FRAMES:
+                    # Re-checked after the clear, so a frame appended meanwhile isn't missed
+                    self._audio_ready.wait(timeout=0.5)
+                    self._audio_ready.clear()
                     continue
 
+                # Consecutive full slots are contiguous in the ring: feed up to
+                # _FEED_FRAMES of them as one span (stops at the ring's end)
+                slot, n = frames.popleft()
+                last, total = slot, n
+                while n == BLOCK_SIZE and frames and last - slot + 1 < _FEED_FRAMES:
+                    if frames[0][0] != last + 1:
+                        break
+                    last, n = frames.popleft()
+                    total += n
+
                 if not self._enabled:
                     continue
 
-                if self._recognizer.AcceptWaveform(data):
-                    result = json.loads(self._recognizer.Result())
-                    text = result.get("text", "").lower()
+                if self._recognizer.AcceptWaveform(as_waveform(ring[slot:last + 1].reshape(-1)[:total])):
+                    result = orjson.loads(self._recognizer.Result())
+                    text = result.get("text", "")
                     if text:
                         logger.debug("Vosk heard: %s", text)
                     if self._matches_wake(text):
@@ -172,8 +230,13 @@ class WakeDetector:
                             logger.info("🎤 Wake phrase detected!")
                             asyncio.run_coroutine_threadsafe(self._on_wake(), self._loop)
                 else:
-                    partial = json.loads(self._recognizer.PartialResult())
-                    partial_text = partial.get("partial", "").lower()
+                    # Scan the raw JSON first (Vosk writes non-ASCII text unescaped);
+                    # only a hit is worth parsing — nearly every partial misses.
+                    raw = self._recognizer.PartialResult()
+                    if not self._matches_wake(raw):
+                        continue
+                    partial = orjson.loads(raw)
+                    partial_text = partial.get("partial", "")
                     if self._matches_wake(partial_text):
                         now = time.time()
                         if now - self._last_trigger > _COOLDOWN:
@@ -190,6 +253,13 @@ class WakeDetector:
 
     def _load_recognizer(self, lang: str, ModelClass, RecognizerClass):
         """Load (or reuse cached) Vosk model for the given language and create a recognizer."""
+        # Toggling back to a language/phrase seen before reuses its recognizer
+        key = (lang, self._wake_phrase)
+        recognizer = self._recognizers.get(key)
+        if recognizer is not None:
+            recognizer.Reset()
+            return recognizer
+
         # Check if model already loaded
         if lang not in self._models:
             model_path = _MODEL_PATHS.get(lang) or self._ensure_model(lang)
@@ -213,6 +283,7 @@ class WakeDetector:
             logger.info("Vosk open-vocabulary recognizer created (lang=%s)", lang)
 
         recognizer.SetWords(False)
+        self._recognizers[key] = recognizer
         return recognizer
 
     def _ensure_model(self, lang: str = "el") -> str:
@@ -3,59 +3,138 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import struct
 import time
 from collections import deque
 from typing import Any
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger("lieutenant-daemon")
 
 # ── Ring-buffer for recent log lines (so new WS clients get context) ──
 _MAX_LOG_HISTORY = 200
+_MAX_LOG_HISTORY_BYTES = 128 * 1024  # also bounds the replay burst to a new client
+_SEND_TIMEOUT_S = 1.0  # a client slower than this is treated as dead
+
+# ── Binary level frames: <u8 kind><u16 rms × 65535>, little-endian ────
+# Sent ~20×/s per level stream, so they skip JSON entirely (3 bytes).
+MSG_MIC_LEVEL = 1
+MSG_TTS_LEVEL = 2
+_LEVEL_FRAME = struct.Struct("<BH")
 
 
 class WSHub:
     """Manages WebSocket connections and broadcasting."""
 
     def __init__(self):
-        self._clients: set[WebSocket] = set()
-        self._lock = asyncio.Lock()
-        self._log_history: deque[dict] = deque(maxlen=_MAX_LOG_HISTORY)
+        # Copy-on-write: every change swaps in a new frozenset, so readers use
+        # the current one without locking and connect/disconnect never wait.
+        self._clients: frozenset[WebSocket] = frozenset()
+        self._lock = asyncio.Lock()  # serializes sends only — keeps per-client frame order
+        self._endpoints: dict[WebSocket, asyncio.Task] = {}  # the ws_endpoint task serving each client
+        self._closing: set[asyncio.Task] = set()
+        # Log lines kept already encoded, with their size: (bytes, frame)
+        self._log_history: deque[tuple[int, str]] = deque()
+        self._log_bytes = 0
+        # Encoded bodies of repeated fixed-shape messages, up to the "ts" value
+        self._frame_prefixes: dict[tuple[str, str], str] = {}
 
     async def connect(self, ws: WebSocket):
         await ws.accept()
-        async with self._lock:
-            self._clients.add(ws)
+        self._clients = self._clients | {ws}
+        self._endpoints[ws] = asyncio.current_task()
         logger.info("WS client connected (%d total)", len(self._clients))
 
     async def disconnect(self, ws: WebSocket):
-        async with self._lock:
-            self._clients.discard(ws)
+        self._clients = self._clients - {ws}
+        self._endpoints.pop(ws, None)
         logger.info("WS client disconnected (%d total)", len(self._clients))
 
     async def broadcast(self, msg: dict[str, Any]):
         """Send a JSON message to all connected clients."""
         msg.setdefault("ts", time.time())
-        payload = json.dumps(msg, ensure_ascii=False)
+        await self.broadcast_frame(orjson.dumps(msg).decode())
+
+    async def broadcast_frame(self, payload: str | bytes):
+        """Send an already-encoded frame to all clients concurrently."""
+        # The lock keeps frames ordered per client; within one frame the
+        # sends run in parallel, so a slow client doesn't delay the rest.
         async with self._lock:
-            dead: list[WebSocket] = []
-            for ws in self._clients:
-                try:
-                    await ws.send_text(payload)
-                except Exception:
-                    dead.append(ws)
-            for ws in dead:
-                self._clients.discard(ws)
+            clients = self._clients
+            if not clients:
+                return
+            if len(clients) == 1:
+                ws, = clients
+                if not await self._safe_send(ws, payload):
+                    self._drop(clients)
+                return
+            ok = await asyncio.gather(*(self._safe_send(ws, payload) for ws in clients))
+            dead = {ws for ws, sent in zip(clients, ok) if not sent}
+            if dead:
+                self._drop(dead)
+
+    def _drop(self, dead: frozenset[WebSocket] | set[WebSocket]):
+        """Stop sending to failed clients and close their sockets, so the UI sees
+        a disconnect and reconnects instead of sitting on a silent connection."""
+        self._clients = self._clients - dead
+        for ws in dead:
+            task = asyncio.ensure_future(self._close(ws))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    async def _close(self, ws: WebSocket):
+        try:
+            await asyncio.wait_for(ws.close(code=1011), timeout=_SEND_TIMEOUT_S)
+            return
+        except Exception:
+            pass
+        # The close frame couldn't go out either — end the endpoint task;
+        # the server then drops the connection.
+        endpoint = self._endpoints.get(ws)
+        if endpoint is not None and not endpoint.done():
+            endpoint.cancel()
+
+    def _fixed_frame(self, msg_type: str, field: str = "", value: str = "") -> str:
+        """Encode a fixed-shape message, reusing its encoding; only ``ts`` is new."""
+        key = (msg_type, value)
+        prefix = self._frame_prefixes.get(key)
+        if prefix is None:
+            body = {"type": msg_type, field: value} if field else {"type": msg_type}
+            prefix = orjson.dumps(body).decode()[:-1] + ',"ts":'
+            self._frame_prefixes[key] = prefix
+        return f"{prefix}{time.time()!r}}}"
+
+    async def _broadcast_fixed(self, msg_type: str, field: str = "", value: str = ""):
+        await self.broadcast_frame(self._fixed_frame(msg_type, field, value))
+
+    @staticmethod
+    async def _safe_send(ws: WebSocket, payload: str | bytes) -> bool:
+        try:
+            send = ws.send_bytes(payload) if isinstance(payload, bytes) else ws.send_text(payload)
+            await asyncio.wait_for(send, timeout=_SEND_TIMEOUT_S)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def prepare_level_frame(kind: int, rms: float) -> bytes:
+        """Encode a mic/tts level as a binary frame, once for every recipient."""
+        q = int(rms * 65535.0 + 0.5)
+        return _LEVEL_FRAME.pack(kind, min(max(q, 0), 65535))
 
     # ── Typed senders ─────────────────────────────────────────────────
-    async def send_state(self, state_value: str):
-        await self.broadcast({"type": "state", "value": state_value})
+    async def send_state(self, state_value: str, ws: WebSocket | None = None):
+        """Broadcast the state, or send it to one client (``ws``) when it connects."""
+        if ws is None:
+            await self._broadcast_fixed("state", "value", state_value)
+        else:
+            await ws.send_text(self._fixed_frame("state", "value", state_value))
 
     async def send_mic_level(self, rms: float):
-        await self.broadcast({"type": "mic.level", "rms": round(rms, 4)})
+        await self.broadcast_frame(self.prepare_level_frame(MSG_MIC_LEVEL, rms))
 
     async def send_stt_partial(self, text: str):
         await self.broadcast({"type": "stt.partial", "text": text})
@@ -67,13 +146,13 @@ class WSHub:
         await self.broadcast({"type": "agent.chunk", "text": text})
 
     async def send_agent_done(self):
-        await self.broadcast({"type": "agent.done"})
+        await self._broadcast_fixed("agent.done")
 
     async def send_llm_backend(self, name: str):
-        await self.broadcast({"type": "llm.backend", "name": name})
+        await self._broadcast_fixed("llm.backend", "name", name)
 
     async def send_tts_level(self, rms: float):
-        await self.broadcast({"type": "tts.level", "rms": round(rms, 4)})
+        await self.broadcast_frame(self.prepare_level_frame(MSG_TTS_LEVEL, rms))
 
     async def send_error(self, message: str):
         await self.broadcast({"type": "error", "message": message})
@@ -81,16 +160,24 @@ class WSHub:
     async def send_log(self, level: str, message: str, source: str = "daemon"):
         """Broadcast a log line to UI and stash in history."""
         entry = {"type": "log", "level": level, "message": message, "source": source, "ts": time.time()}
-        self._log_history.append(entry)
-        await self.broadcast(entry)
+        raw = orjson.dumps(entry)
+        frame = raw.decode()
+        history = self._log_history
+        history.append((len(raw), frame))
+        self._log_bytes += len(raw)
+        # Evict oldest past either cap, but always keep the newest line
+        while len(history) > 1 and (len(history) > _MAX_LOG_HISTORY or self._log_bytes > _MAX_LOG_HISTORY_BYTES):
+            self._log_bytes -= history.popleft()[0]
+        await self.broadcast_frame(frame)
 
     async def send_log_history(self, ws: WebSocket):
-        """Send buffered log history to a newly connected client."""
-        for entry in self._log_history:
-            try:
-                await ws.send_text(json.dumps(entry, ensure_ascii=False))
-            except Exception:
-                break
+        """Send buffered log history to a newly connected client, as one log.batch frame."""
+        if not self._log_history:
+            return
+        # The stored lines are already JSON — splice them, don't re-encode
+        batch = '{"type":"log.batch","entries":[' + ",".join(f for _, f in self._log_history) + "]}"
+        if not await self._safe_send(ws, batch):
+            self._drop({ws})
 
     @property
     def client_count(self) -> int:
@@ -1,11 +1,15 @@
 /* ── WebSocket hook — connects to voice-daemon ──────────────────── */
 
 import { useCallback, useEffect, useRef, useState } from "react";
-import type { DaemonState, WSMessage } from "../types";
+import type { DaemonState, LogBatchMsg, WSMessage } from "../types";
 
 const WS_URL = `ws://127.0.0.1:${import.meta.env.VITE_DAEMON_PORT ?? 8765}/ws`;
 const RECONNECT_DELAY = 2000;
 
+/* Binary level frames from the daemon: <u8 kind><u16 rms × 65535> LE */
+const MSG_MIC_LEVEL = 1;
+const MSG_TTS_LEVEL = 2;
+
 export interface LogEntry {
   ts: number;
   level: string;
@@ -14,6 +18,15 @@ export interface LogEntry {
 }
 
 const MAX_LOGS = 500;
+
+function toLogEntry(m: any): LogEntry {
+  return {
+    ts: m.ts ?? Date.now() / 1000,
+    level: m.level ?? "INFO",
+    message: m.message ?? "",
+    source: m.source ?? "daemon",
+  };
+}
 const MAX_CHAT = 200;
 
 export interface ChatMessage {
@@ -80,6 +93,7 @@ export function useDaemon(): DaemonStore {
     if (wsRef.current?.readyState === WebSocket.CONNECTING) return;
 
     const ws = new WebSocket(WS_URL);
+    ws.binaryType = "arraybuffer";
     wsRef.current = ws;
 
     ws.onopen = () => {
@@ -106,6 +120,15 @@ export function useDaemon(): DaemonStore {
     };
 
     ws.onmessage = (event) => {
+      if (event.data instanceof ArrayBuffer) {
+        const view = new DataView(event.data);
+        if (view.byteLength < 3) return;
+        const rms = view.getUint16(1, true) / 65535;
+        const kind = view.getUint8(0);
+        if (kind === MSG_MIC_LEVEL) setMicRms(rms);
+        else if (kind === MSG_TTS_LEVEL) setTtsRms(rms);
+        return;
+      }
       try {
         const msg: WSMessage = JSON.parse(event.data);
         switch (msg.type) {
@@ -197,18 +220,22 @@ export function useDaemon(): DaemonStore {
             break;
           }
           case "log": {
-            const entry: LogEntry = {
-              ts: (msg as any).ts ?? Date.now() / 1000,
-              level: (msg as any).level ?? "INFO",
-              message: (msg as any).message ?? "",
-              source: (msg as any).source ?? "daemon",
-            };
+            const entry = toLogEntry(msg);
             setLogs((prev) => {
               const next = [...prev, entry];
               return next.length > MAX_LOGS ? next.slice(-MAX_LOGS) : next;
             });
             break;
           }
+          case "log.batch": {
+            // Backlog replayed on connect — one state update for all of it
+            const entries = ((msg as LogBatchMsg).entries ?? []).map(toLogEntry);
+            setLogs((prev) => {
+              const next = [...prev, ...entries];
+              return next.length > MAX_LOGS ? next.slice(-MAX_LOGS) : next;
+            });
+            break;
+          }
         }
       } catch {
         // ignore parse errors
@@ -53,3 +53,8 @@ export interface LogMsg extends WSMessage {
   message: string;
   source: string;
 }
+
+export interface LogBatchMsg extends WSMessage {
+  type: "log.batch";
+  entries: LogMsg[];
+}